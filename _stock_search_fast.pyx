@@ -0,0 +1,36 @@
+# cython: language_level=3, boundscheck=False, wraparound=False
+"""
+Optional compiled fast path for ticker prefix search (used by stock_search).
+
+Build in place with:  cythonize -i _stock_search_fast.pyx
+"""
+
+
+def prefix_search(str query, tuple tickers_sorted) -> list:
+    """
+    Indexes into `tickers_sorted` of every ticker starting with `query`.
+    
+    Args:
+        query: Upper-cased ticker prefix
+        tickers_sorted: Tickers in ascending order
+    
+    Returns:
+        List of matching indexes, in sorted ticker order
+    """
+    cdef Py_ssize_t lo = 0
+    cdef Py_ssize_t hi = len(tickers_sorted)
+    cdef Py_ssize_t mid
+    cdef list found = []
+    
+    # Bisect to the first ticker >= query; every match follows it contiguously
+    while lo < hi:
+        mid = (lo + hi) >> 1
+        if <str>tickers_sorted[mid] < query:
+            lo = mid + 1
+        else:
+            hi = mid
+    
+    while lo < len(tickers_sorted) and (<str>tickers_sorted[lo]).startswith(query):
+        found.append(lo)
+        lo += 1
+    return found
@@ -4,17 +4,20 @@ Stock Indicator App with Search, Signals, and Trend Insights
 """
 
 import streamlit as st
+import numpy as np
 import pandas as pd
 import plotly.graph_objects as go
 from plotly.subplots import make_subplots
-from datetime import datetime, timedelta
-from typing import Dict
+import html
+import json
+from typing import Dict, List, Tuple
 
-from data_fetcher import get_stock_data, get_stock_info
-from indicators import calculate_all_indicators, get_price_trend
+from cache import PRICE_TTL
+from data_fetcher import get_stock_data
+from indicators import calculate_all_indicators, get_price_trend, njit
 from signal_engine import generate_short_term_signal, generate_long_term_signal
 from trend_analysis import generate_trend_summary, get_market_sentiment, get_price_momentum
-from stock_search import search_stocks, get_all_stocks, get_stock_display_name
+from stock_search import search_stocks, get_all_stocks
 
 
 # Page configuration
@@ -26,101 +29,444 @@ st.set_page_config(
 )
 
 # Custom CSS
-st.markdown("""
-    <style>
-    .main-header {
-        font-size: 2.5rem;
-        font-weight: bold;
-        color: #1f77b4;
-        text-align: center;
-        margin-bottom: 2rem;
-    }
-    .signal-box {
-        padding: 1rem;
-        border-radius: 0.5rem;
-        margin: 0.5rem 0;
-    }
-    .signal-buy {
-        background-color: #d4edda;
-        border: 2px solid #28a745;
-    }
-    .signal-sell {
-        background-color: #f8d7da;
-        border: 2px solid #dc3545;
-    }
-    .signal-hold {
-        background-color: #fff3cd;
-        border: 2px solid #ffc107;
-    }
-    .metric-card {
-        background-color: #f8f9fa;
-        padding: 1rem;
-        border-radius: 0.5rem;
-        border-left: 4px solid #1f77b4;
-    }
-    </style>
-""", unsafe_allow_html=True)
+CUSTOM_CSS = """
+.main-header {
+    font-size: 2.5rem;
+    font-weight: bold;
+    color: #1f77b4;
+    text-align: center;
+    margin-bottom: 2rem;
+}
+.signal-box {
+    padding: 1rem;
+    border-radius: 0.5rem;
+    margin: 0.5rem 0;
+}
+.signal-buy {
+    background-color: #d4edda;
+    border: 2px solid #28a745;
+}
+.signal-sell {
+    background-color: #f8d7da;
+    border: 2px solid #dc3545;
+}
+.signal-hold {
+    background-color: #fff3cd;
+    border: 2px solid #ffc107;
+}
+.metric-card {
+    background-color: #f8f9fa;
+    padding: 1rem;
+    border-radius: 0.5rem;
+    border-left: 4px solid #1f77b4;
+}
+"""
 
 
-def create_price_chart(price_data: pd.DataFrame, indicators: Dict):
-    """Create interactive price chart with moving averages."""
-    fig = make_subplots(
+@st.cache_resource
+def _css_markup() -> str:
+    """Collapse the custom CSS into a compact <style> tag once per process."""
+    return f"<style>{' '.join(CUSTOM_CSS.split())}</style>"
+
+
+# Streamlit drops elements that are not re-emitted on a rerun, so the style
+# tag is sent every time; keeping it compact keeps that payload small.
+st.markdown(_css_markup(), unsafe_allow_html=True)
+
+
+@st.cache_data(ttl=PRICE_TTL, max_entries=128, show_spinner=False)
+def _cached_stock_data(ticker: str, period: str) -> Dict:
+    """Fetch stock data, reusing the result across reruns for PRICE_TTL seconds."""
+    return get_stock_data(ticker, period)
+
+
+MANUAL_ENTRY_OPTION = "📝 Enter ticker manually"
+
+
+def _build_stock_options(stocks: List[Dict]) -> Tuple[List[str], Dict[str, int]]:
+    """
+    Format selectbox labels ("TICKER - Company Name") for a list of stocks.
+    
+    Returns:
+        Tuple of (labels with the manual-entry option first, ticker -> label index)
+    """
+    labels = [MANUAL_ENTRY_OPTION] + [f"{stock['ticker']} - {stock['name']}" for stock in stocks]
+    # Offset by one for the manual-entry option at index 0
+    ticker_to_index = {stock['ticker']: i for i, stock in enumerate(stocks, start=1)}
+    return labels, ticker_to_index
+
+
+@st.cache_resource
+def _all_stock_options() -> Tuple[List[str], Dict[str, int]]:
+    """Build selectbox options for the full stock list once per process."""
+    return _build_stock_options(get_all_stocks())
+
+
+@st.cache_data(max_entries=256, show_spinner=False)
+def _search_stock_options(query: str, limit: int) -> Tuple[List[str], Dict[str, int]]:
+    """Build selectbox options for a search, reusing queries typed before."""
+    return _build_stock_options(search_stocks(query, limit=limit))
+
+
+def _frame_fingerprint(df: pd.DataFrame) -> Tuple:
+    """Cheap cache key for a price frame: its length, date span and last row."""
+    if df.empty:
+        return (0,)
+    return (len(df), str(df.index[0]), str(df.index[-1]), *df.iloc[-1].tolist())
+
+
+# Analysis results only depend on the fetched frame, so hash it by fingerprint
+# instead of letting Streamlit hash every cell. Arguments prefixed with an
+# underscore are derived from the same fetch and are excluded from the key.
+_ANALYSIS_CACHE = dict(
+    ttl=PRICE_TTL,
+    max_entries=128,
+    show_spinner=False,
+    hash_funcs={pd.DataFrame: _frame_fingerprint}
+)
+
+
+@st.cache_data(**_ANALYSIS_CACHE)
+def _cached_indicators(price_data: pd.DataFrame) -> Dict:
+    return calculate_all_indicators(price_data)
+
+
+@st.cache_data(**_ANALYSIS_CACHE)
+def _cached_short_term_signal(price_data: pd.DataFrame, _indicators: Dict) -> Tuple[str, str]:
+    return generate_short_term_signal(_indicators, price_data)
+
+
+@st.cache_data(**_ANALYSIS_CACHE)
+def _cached_long_term_signal(ticker: str, price_data: pd.DataFrame, _indicators: Dict,
+                             _recommendations: List) -> Tuple[str, str]:
+    return generate_long_term_signal(_indicators, price_data, _recommendations)
+
+
+@st.cache_data(**_ANALYSIS_CACHE)
+def _cached_trend_summary(ticker: str, price_data: pd.DataFrame, _indicators: Dict,
+                          _recommendations: List, _news: List, _info: Dict) -> str:
+    return generate_trend_summary(ticker, _indicators, price_data, _recommendations, _news, _info)
+
+
+@st.cache_data(**_ANALYSIS_CACHE)
+def _cached_price_momentum(price_data: pd.DataFrame) -> Dict:
+    return get_price_momentum(price_data)
+
+
+@st.cache_data(**_ANALYSIS_CACHE)
+def _cached_market_sentiment(ticker: str, period: str, _news: List, _recommendations: List) -> Dict:
+    return get_market_sentiment(_news, _recommendations)
+
+
+# Maximum number of points per chart trace; longer series are downsampled
+CHART_MAX_POINTS = 2000
+
+
+@njit(cache=True)
+def _lttb_kernel(x: np.ndarray, y: np.ndarray, n_out: int) -> np.ndarray:
+    n = len(y)
+    every = (n - 2) / (n_out - 2)
+    selected = np.empty(n_out, dtype=np.int64)
+    selected[0] = 0
+    a = 0
+    
+    for i in range(n_out - 2):
+        start = int(i * every) + 1
+        end = int((i + 1) * every) + 1
+        next_end = min(int((i + 2) * every) + 1, n)
+        
+        # Average of the next bucket is the third triangle vertex
+        avg_x = x[end:next_end].mean()
+        avg_y = y[end:next_end].mean()
+        
+        area = np.abs(
+            (x[a] - avg_x) * (y[start:end] - y[a]) - (x[a] - x[start:end]) * (avg_y - y[a])
+        )
+        a = start + int(np.argmax(area))
+        selected[i + 1] = a
+    
+    selected[-1] = n - 1
+    return selected
+
+
+def lttb_indices(x: np.ndarray, y: np.ndarray, n_out: int) -> np.ndarray:
+    """
+    Select indices with Largest-Triangle-Three-Buckets downsampling.
+    
+    Args:
+        x: Monotonic x values (e.g. int64 timestamps)
+        y: Values to preserve the visual shape of
+        n_out: Number of points to keep (first and last are always kept)
+    
+    Returns:
+        Sorted array of selected indices
+    """
+    n = len(y)
+    if n_out >= n or n_out < 3:
+        return np.arange(n)
+    
+    return _lttb_kernel(np.asarray(x, dtype=np.float64), np.asarray(y, dtype=np.float64), n_out)
+
+
+@st.cache_resource
+def _chart_layout() -> Dict:
+    """
+    Build the price chart layout once per process.
+    
+    The subplot axes and titles never change, so they are derived from
+    make_subplots a single time instead of on every script rerun.
+    """
+    layout = make_subplots(
         rows=2, cols=1,
         shared_xaxes=True,
         vertical_spacing=0.03,
         subplot_titles=('Price & Moving Averages', 'RSI'),
         row_width=[0.7, 0.3]
+    ).to_dict()['layout']
+    layout.pop('template', None)
+    layout.update(
+        height=600,
+        showlegend=True,
+        hovermode='x unified',
+        title={'text': "Stock Analysis Chart"}
     )
+    layout['xaxis2']['title'] = {'text': "Date"}
+    layout['yaxis']['title'] = {'text': "Price ($)"}
+    layout['yaxis2']['title'] = {'text': "RSI"}
+    return layout
+
+
+# (indicator key, trace name, line color, y axis)
+_INDICATOR_TRACES = [
+    ('sma_20', 'SMA 20', 'orange', 'y'),
+    ('sma_50', 'SMA 50', 'green', 'y'),
+    ('sma_200', 'SMA 200', 'red', 'y'),
+    ('rsi', 'RSI', 'purple', 'y2'),
+]
+
+# RSI reference lines: (level, dash, color, opacity)
+_RSI_LEVELS = [(70, 'dash', 'red', 0.5), (30, 'dash', 'green', 0.5), (50, 'dot', 'gray', 0.3)]
+
+
+def create_price_chart(price_data: pd.DataFrame, indicators: Dict):
+    """Create interactive price chart with moving averages."""
+    # Hand Plotly numpy arrays (and a DatetimeIndex for x) so it can serialize each trace vectorized
+    close = price_data['Close'].to_numpy()
+    
+    # Downsample once against Close so all traces share the same x points
+    idx = lttb_indices(price_data.index.asi8 if isinstance(price_data.index, pd.DatetimeIndex)
+                       else np.arange(len(price_data)),
+                       close, CHART_MAX_POINTS)
+    x = price_data.index[idx]
     
     # Price and Moving Averages
-    fig.add_trace(
-        go.Scatter(x=price_data.index, y=price_data['Close'], name='Close Price', line=dict(color='#1f77b4', width=2)),
-        row=1, col=1
-    )
+    traces = [{
+        'type': 'scattergl', 'x': x, 'y': close[idx], 'name': 'Close Price',
+        'xaxis': 'x', 'yaxis': 'y', 'line': {'color': '#1f77b4', 'width': 2}
+    }]
+    shapes = []
     
     indicator_series = indicators.get('indicators', {})
     
-    if 'sma_20' in indicator_series and not indicator_series['sma_20'].empty:
-        fig.add_trace(
-            go.Scatter(x=price_data.index, y=indicator_series['sma_20'], name='SMA 20', line=dict(color='orange', width=1)),
-            row=1, col=1
-        )
+    for key, name, color, yaxis in _INDICATOR_TRACES:
+        series = indicator_series.get(key)
+        if series is None or series.empty:
+            continue
+        traces.append({
+            'type': 'scattergl', 'x': x, 'y': series.to_numpy()[idx], 'name': name,
+            'xaxis': 'x' if yaxis == 'y' else 'x2', 'yaxis': yaxis,
+            'line': {'color': color, 'width': 1}
+        })
+        if key == 'rsi':
+            # Add RSI reference lines
+            shapes.extend(
+                {'type': 'line', 'xref': 'x2 domain', 'x0': 0, 'x1': 1, 'yref': 'y2', 'y0': level, 'y1': level,
+                 'line': {'dash': dash, 'color': line_color}, 'opacity': opacity}
+                for level, dash, line_color, opacity in _RSI_LEVELS
+            )
+    
+    layout = dict(_chart_layout(), shapes=shapes)
+    # Everything above is built from known-good literals; skip per-property validation
+    return go.Figure({'data': traces, 'layout': layout}, _validate=False)
+
+
+def _render_overview(ticker: str, info: Dict, price_data: pd.DataFrame, indicators: Dict):
+    """Render the Overview tab: company info and latest indicator values."""
+    latest = indicators['latest']
+    sma_20, sma_50, momentum = (latest.get(k) for k in ('sma_20', 'sma_50', 'momentum'))
     
-    if 'sma_50' in indicator_series and not indicator_series['sma_50'].empty:
-        fig.add_trace(
-            go.Scatter(x=price_data.index, y=indicator_series['sma_50'], name='SMA 50', line=dict(color='green', width=1)),
-            row=1, col=1
-        )
+    st.subheader("Stock Overview")
     
-    if 'sma_200' in indicator_series and not indicator_series['sma_200'].empty:
-        fig.add_trace(
-            go.Scatter(x=price_data.index, y=indicator_series['sma_200'], name='SMA 200', line=dict(color='red', width=1)),
-            row=1, col=1
+    # Stock info
+    col1, col2 = st.columns(2)
+    # One markdown block per column; trailing double spaces are line breaks and
+    # dollar signs are escaped so a pair of them isn't rendered as inline math
+    with col1:
+        st.markdown(
+            f"**Ticker:** {ticker}  \n"
+            f"**Company:** {info.get('longName', 'N/A')}  \n"
+            f"**Sector:** {info.get('sector', 'N/A')}  \n"
+            f"**Industry:** {info.get('industry', 'N/A')}"
         )
     
-    # RSI
-    if 'rsi' in indicator_series and not indicator_series['rsi'].empty:
-        fig.add_trace(
-            go.Scatter(x=price_data.index, y=indicator_series['rsi'], name='RSI', line=dict(color='purple', width=1)),
-            row=2, col=1
+    with col2:
+        market_cap = info.get('marketCap', 0)
+        market_cap_line = f"**Market Cap:** \\${market_cap / 1e9:.2f}B  \n" if market_cap else ""
+        st.markdown(
+            f"{market_cap_line}"
+            f"**PE Ratio:** {info.get('trailingPE', 'N/A')}  \n"
+            f"**52W High:** \\${info.get('fiftyTwoWeekHigh', 'N/A')}  \n"
+            f"**52W Low:** \\${info.get('fiftyTwoWeekLow', 'N/A')}"
         )
-        # Add RSI reference lines
-        fig.add_hline(y=70, line_dash="dash", line_color="red", opacity=0.5, row=2, col=1)
-        fig.add_hline(y=30, line_dash="dash", line_color="green", opacity=0.5, row=2, col=1)
-        fig.add_hline(y=50, line_dash="dot", line_color="gray", opacity=0.3, row=2, col=1)
     
-    fig.update_layout(
-        height=600,
-        showlegend=True,
-        hovermode='x unified',
-        title_text="Stock Analysis Chart"
+    st.divider()
+    
+    # Technical Indicators
+    st.subheader("Technical Indicators")
+    col1, col2, col3, col4 = st.columns(4)
+    
+    with col1:
+        st.metric("SMA 20", f"${sma_20:.2f}" if sma_20 else "N/A")
+    with col2:
+        st.metric("SMA 50", f"${sma_50:.2f}" if sma_50 else "N/A")
+    with col3:
+        st.metric("Momentum (10d)", f"{momentum:.1f}%" if momentum else "N/A")
+    with col4:
+        series = indicators['indicators']
+        trend = get_price_trend(price_data, series['sma_20'], series['sma_50'])
+        st.metric("Trend", trend)
+
+
+def _render_charts(price_data: pd.DataFrame, indicators: Dict):
+    """Render the Charts tab."""
+    st.subheader("Price Chart & Indicators")
+    fig = create_price_chart(price_data, indicators)
+    st.plotly_chart(fig, use_container_width=True)
+
+
+# CSS class per signal; every HOLD variant ("HOLD (Bullish)", ...) falls back to signal-hold
+SIGNAL_CLASS = {'BUY': 'signal-buy', 'SELL': 'signal-sell'}
+
+
+def _signal_box_html(signal: str, reason: str) -> str:
+    """Build a styled signal box as a single HTML snippet."""
+    signal_class = SIGNAL_CLASS.get(signal, 'signal-hold')
+    return (
+        f'<div class="signal-box {signal_class}">'
+        f'<b>Signal:</b> {html.escape(signal)}<br>'
+        f'<b>Reason:</b> {html.escape(reason)}'
+        '</div>'
     )
+
+
+@st.cache_data(max_entries=256, show_spinner=False)
+def _signal_details_json(short_signal: str, short_reason: str, long_signal: str, long_reason: str) -> str:
+    """Serialize the signal details once per distinct set of signals."""
+    return json.dumps({
+        "short_term": {
+            "signal": short_signal,
+            "reasoning": short_reason
+        },
+        "long_term": {
+            "signal": long_signal,
+            "reasoning": long_reason
+        }
+    }, indent=2)
+
+
+def _render_signals(ticker: str, price_data: pd.DataFrame, indicators: Dict, recommendations: List):
+    """Render the Signals tab: short- and long-term signals with reasoning."""
+    st.subheader("Trading Signals")
+    
+    # Generate signals
+    short_signal, short_reason = _cached_short_term_signal(price_data, indicators)
+    long_signal, long_reason = _cached_long_term_signal(ticker, price_data, indicators, recommendations)
     
-    fig.update_xaxes(title_text="Date", row=2, col=1)
-    fig.update_yaxes(title_text="Price ($)", row=1, col=1)
-    fig.update_yaxes(title_text="RSI", row=2, col=1)
+    col1, col2 = st.columns(2)
     
-    return fig
+    with col1:
+        st.markdown("### Short-Term Signal (1-14 days)")
+        st.markdown(_signal_box_html(short_signal, short_reason), unsafe_allow_html=True)
+    
+    with col2:
+        st.markdown("### Long-Term Signal (1-12 months)")
+        st.markdown(_signal_box_html(long_signal, long_reason), unsafe_allow_html=True)
+    
+    st.divider()
+    
+    # Signal details
+    st.markdown("### Signal Analysis Details")
+    st.code(_signal_details_json(short_signal, short_reason, long_signal, long_reason), language='json')
+
+
+def _render_insights(ticker: str, period: str, price_data: pd.DataFrame, indicators: Dict,
+                     recommendations: List, news: List, info: Dict):
+    """Render the Insights tab: trend summary, momentum, sentiment and news."""
+    st.subheader("What's Going On With This Stock?")
+    
+    # Trend Summary
+    trend_summary = _cached_trend_summary(ticker, price_data, indicators, recommendations, news, info)
+    st.markdown("### 📊 Trend Summary")
+    st.info(trend_summary)
+    
+    st.divider()
+    
+    # Price Momentum
+    st.markdown("### 📈 Price Momentum")
+    momentum_data = _cached_price_momentum(price_data)
+    if momentum_data:
+        momentum_df = pd.Series(momentum_data, name='Momentum %').rename_axis('Period').reset_index()
+        st.dataframe(momentum_df, use_container_width=True)
+    
+    st.divider()
+    
+    # Market Sentiment
+    st.markdown("### 💭 Market Sentiment")
+    sentiment = _cached_market_sentiment(ticker, period, news, recommendations)
+    
+    col1, col2 = st.columns(2)
+    with col1:
+        st.metric("Recent News Articles", sentiment['news_count'])
+    with col2:
+        rec_summary = sentiment.get('recommendation_summary', {})
+        if rec_summary:
+            st.write(f"**Analyst Recommendations:**")
+            st.write(f"- Buy: {rec_summary.get('buy', 0)}")
+            st.write(f"- Hold: {rec_summary.get('hold', 0)}")
+            st.write(f"- Sell: {rec_summary.get('sell', 0)}")
+    
+    st.divider()
+    
+    # Recent News
+    if news:
+        st.markdown("### 📰 Recent News")
+        recent_news = pd.DataFrame(news[:5], columns=['title', 'publisher', 'link', 'published'])
+        # Format all timestamps in one pass; feeds mix naive (UTC) and aware datetimes
+        recent_news['published'] = pd.to_datetime(
+            recent_news['published'], utc=True, errors='coerce'
+        ).dt.strftime('%Y-%m-%d %H:%M')
+        recent_news = recent_news.fillna({'title': 'No title', 'publisher': 'N/A', 'link': '', 'published': ''})
+        
+        for item in recent_news.itertuples(index=False):
+            with st.expander(item.title):
+                st.write(f"**Publisher:** {item.publisher}")
+                if item.published:
+                    st.write(f"**Published:** {item.published}")
+                if item.link:
+                    st.markdown(f"[Read more]({item.link})")
+    
+    # Analyst Recommendations
+    if recommendations:
+        st.markdown("### 🎯 Analyst Recommendations")
+        # Build only the columns we display; drop ones the data doesn't have
+        recent = recommendations[-10:]
+        rec_df = pd.DataFrame({
+            col: [rec.get(col) for rec in recent]
+            for col in ('firm', 'toGrade', 'fromGrade', 'action')
+        }).dropna(how='all', axis=1)
+        
+        if not rec_df.empty:
+            st.dataframe(rec_df, use_container_width=True)
 
 
 def main():
@@ -142,28 +488,13 @@ def main():
     
     # Get filtered stocks based on search, or all stocks if no search
     if search_query:
-        stock_options = search_stocks(search_query, limit=100)
+        selectbox_options, ticker_to_index = _search_stock_options(search_query, 100)
     else:
-        stock_options = get_all_stocks()
-    
-    # Create formatted options for selectbox: "TICKER - Company Name"
-    if stock_options:
-        selectbox_options = [f"{stock['ticker']} - {stock['name']}" for stock in stock_options]
-    else:
-        selectbox_options = []
-    
-    # Add manual entry option at the beginning
-    selectbox_options.insert(0, "📝 Enter ticker manually")
+        selectbox_options, ticker_to_index = _all_stock_options()
     
     # Find current selection index
     current_ticker = st.session_state.get('ticker', 'AAPL')
-    current_index = 0
-    if current_ticker:
-        # Try to find current ticker in options
-        for i, opt in enumerate(selectbox_options):
-            if opt.startswith(current_ticker + " -") or (opt == "📝 Enter ticker manually" and i == 0):
-                current_index = i
-                break
+    current_index = ticker_to_index.get(current_ticker, 0)
     
     # Stock selection dropdown
     selected_option = st.sidebar.selectbox(
@@ -174,7 +505,7 @@ def main():
     )
     
     # Handle ticker extraction
-    if selected_option == "📝 Enter ticker manually":
+    if selected_option == MANUAL_ENTRY_OPTION:
         # Manual entry mode
         ticker_input = st.sidebar.text_input(
             "Enter Stock Ticker",
@@ -206,7 +537,7 @@ def main():
     
     # Fetch data
     with st.spinner(f"Fetching data for {ticker}..."):
-        stock_data = get_stock_data(ticker, period)
+        stock_data = _cached_stock_data(ticker, period)
     
     if not stock_data.get('success', False):
         st.error(f"❌ Error: {stock_data.get('error', 'Failed to fetch stock data')}")
@@ -214,6 +545,11 @@ def main():
         return
     
     price_data = stock_data['price_data']
+    # float32 keeps ~7 significant digits, plenty for prices, and halves the
+    # memory walked by the rolling indicators and the chart payload
+    price_data = price_data.astype(
+        {col: 'float32' for col in ('Open', 'High', 'Low', 'Close') if col in price_data.columns}
+    )
     current_price = stock_data['current_price']
     info = stock_data.get('info', {})
     recommendations = stock_data.get('recommendations', [])
@@ -221,20 +557,20 @@ def main():
     
     # Calculate indicators
     with st.spinner("Calculating technical indicators..."):
-        indicators = calculate_all_indicators(price_data)
+        indicators = _cached_indicators(price_data)
     
     if not indicators.get('success', False):
         st.error("Failed to calculate indicators")
         return
     
     latest = indicators['latest']
+    rsi_val, sma_200, volatility = (latest.get(k) for k in ('rsi', 'sma_200', 'volatility'))
     
     # Header with current price
     col1, col2, col3, col4 = st.columns(4)
     with col1:
         st.metric("Current Price", f"${current_price:.2f}" if current_price else "N/A")
     with col2:
-        rsi_val = latest.get('rsi')
         rsi_color = "normal"
         if rsi_val:
             if rsi_val < 30:
@@ -243,10 +579,8 @@ def main():
                 rsi_color = "off"
         st.metric("RSI", f"{rsi_val:.1f}" if rsi_val else "N/A", delta=None)
     with col3:
-        sma_200 = latest.get('sma_200')
         st.metric("SMA 200", f"${sma_200:.2f}" if sma_200 else "N/A")
     with col4:
-        volatility = latest.get('volatility')
         st.metric("Volatility", f"{volatility:.1f}%" if volatility else "N/A")
     
     st.divider()
@@ -255,147 +589,16 @@ def main():
     tab1, tab2, tab3, tab4 = st.tabs(["📊 Overview", "📈 Charts", "🎯 Signals", "📰 Insights"])
     
     with tab1:
-        st.subheader("Stock Overview")
-        
-        # Stock info
-        col1, col2 = st.columns(2)
-        with col1:
-            st.write(f"**Ticker:** {ticker}")
-            st.write(f"**Company:** {info.get('longName', 'N/A')}")
-            st.write(f"**Sector:** {info.get('sector', 'N/A')}")
-            st.write(f"**Industry:** {info.get('industry', 'N/A')}")
-        
-        with col2:
-            market_cap = info.get('marketCap', 0)
-            if market_cap:
-                market_cap_b = market_cap / 1e9
-                st.write(f"**Market Cap:** ${market_cap_b:.2f}B")
-            st.write(f"**PE Ratio:** {info.get('trailingPE', 'N/A')}")
-            st.write(f"**52W High:** ${info.get('fiftyTwoWeekHigh', 'N/A')}")
-            st.write(f"**52W Low:** ${info.get('fiftyTwoWeekLow', 'N/A')}")
-        
-        st.divider()
-        
-        # Technical Indicators
-        st.subheader("Technical Indicators")
-        col1, col2, col3, col4 = st.columns(4)
-        
-        with col1:
-            st.metric("SMA 20", f"${latest.get('sma_20', 0):.2f}" if latest.get('sma_20') else "N/A")
-        with col2:
-            st.metric("SMA 50", f"${latest.get('sma_50', 0):.2f}" if latest.get('sma_50') else "N/A")
-        with col3:
-            momentum = latest.get('momentum')
-            st.metric("Momentum (10d)", f"{momentum:.1f}%" if momentum else "N/A")
-        with col4:
-            trend = get_price_trend(price_data, indicators['indicators']['sma_20'], indicators['indicators']['sma_50'])
-            st.metric("Trend", trend)
+        _render_overview(ticker, info, price_data, indicators)
     
     with tab2:
-        st.subheader("Price Chart & Indicators")
-        fig = create_price_chart(price_data, indicators)
-        st.plotly_chart(fig, use_container_width=True)
+        _render_charts(price_data, indicators)
     
     with tab3:
-        st.subheader("Trading Signals")
-        
-        # Generate signals
-        short_signal, short_reason = generate_short_term_signal(indicators, price_data)
-        long_signal, long_reason = generate_long_term_signal(indicators, price_data, recommendations)
-        
-        col1, col2 = st.columns(2)
-        
-        with col1:
-            st.markdown("### Short-Term Signal (1-14 days)")
-            signal_class = "signal-buy" if short_signal == "BUY" else "signal-sell" if short_signal == "SELL" else "signal-hold"
-            st.markdown(f'<div class="signal-box {signal_class}">', unsafe_allow_html=True)
-            st.markdown(f"**Signal:** {short_signal}")
-            st.markdown(f"**Reason:** {short_reason}")
-            st.markdown('</div>', unsafe_allow_html=True)
-        
-        with col2:
-            st.markdown("### Long-Term Signal (1-12 months)")
-            signal_class = "signal-buy" if "BUY" in long_signal else "signal-sell" if "SELL" in long_signal else "signal-hold"
-            st.markdown(f'<div class="signal-box {signal_class}">', unsafe_allow_html=True)
-            st.markdown(f"**Signal:** {long_signal}")
-            st.markdown(f"**Reason:** {long_reason}")
-            st.markdown('</div>', unsafe_allow_html=True)
-        
-        st.divider()
-        
-        # Signal details
-        st.markdown("### Signal Analysis Details")
-        st.json({
-            "short_term": {
-                "signal": short_signal,
-                "reasoning": short_reason
-            },
-            "long_term": {
-                "signal": long_signal,
-                "reasoning": long_reason
-            }
-        })
+        _render_signals(ticker, price_data, indicators, recommendations)
     
     with tab4:
-        st.subheader("What's Going On With This Stock?")
-        
-        # Trend Summary
-        trend_summary = generate_trend_summary(ticker, indicators, price_data, recommendations, news, info)
-        st.markdown("### 📊 Trend Summary")
-        st.info(trend_summary)
-        
-        st.divider()
-        
-        # Price Momentum
-        st.markdown("### 📈 Price Momentum")
-        momentum_data = get_price_momentum(price_data)
-        if momentum_data:
-            momentum_df = pd.DataFrame(list(momentum_data.items()), columns=['Period', 'Momentum %'])
-            st.dataframe(momentum_df, use_container_width=True)
-        
-        st.divider()
-        
-        # Market Sentiment
-        st.markdown("### 💭 Market Sentiment")
-        sentiment = get_market_sentiment(news, recommendations)
-        
-        col1, col2 = st.columns(2)
-        with col1:
-            st.metric("Recent News Articles", sentiment['news_count'])
-        with col2:
-            rec_summary = sentiment.get('recommendation_summary', {})
-            if rec_summary:
-                st.write(f"**Analyst Recommendations:**")
-                st.write(f"- Buy: {rec_summary.get('buy', 0)}")
-                st.write(f"- Hold: {rec_summary.get('hold', 0)}")
-                st.write(f"- Sell: {rec_summary.get('sell', 0)}")
-        
-        st.divider()
-        
-        # Recent News
-        if news:
-            st.markdown("### 📰 Recent News")
-            for item in news[:5]:
-                with st.expander(item.get('title', 'No title')):
-                    st.write(f"**Publisher:** {item.get('publisher', 'N/A')}")
-                    if item.get('published'):
-                        st.write(f"**Published:** {item['published'].strftime('%Y-%m-%d %H:%M')}")
-                    if item.get('link'):
-                        st.markdown(f"[Read more]({item['link']})")
-        
-        # Analyst Recommendations
-        if recommendations:
-            st.markdown("### 🎯 Analyst Recommendations")
-            rec_df = pd.DataFrame(recommendations[-10:])
-            if not rec_df.empty:
-                # Clean up the dataframe for display
-                display_cols = []
-                for col in ['firm', 'toGrade', 'fromGrade', 'action']:
-                    if col in rec_df.columns:
-                        display_cols.append(col)
-                
-                if display_cols:
-                    st.dataframe(rec_df[display_cols], use_container_width=True)
+        _render_insights(ticker, period, price_data, indicators, recommendations, news, info)
 
 
 if __name__ == "__main__":
@@ -0,0 +1,156 @@
+"""
+Cache Module
+Two-tier TTL cache for fetched stock data:
+- In-process LRU dict for hot tickers (always on)
+- Optional shared Redis tier, enabled when the `redis` package is
+  installed and REDIS_URL is set (e.g. redis://localhost:6379/0)
+On a miss in both tiers callers fall back to the live yfinance path.
+"""
+
+import logging
+import os
+import pickle
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Optional
+
+try:
+    import redis
+except ImportError:  # redis is optional
+    redis = None
+
+
+logger = logging.getLogger(__name__)
+
+# Default TTLs in seconds; PRICE_TTL is also the app's own price cache TTL,
+# so the two tiers expire together
+PRICE_TTL = 5 * 60
+INFO_TTL = 24 * 60 * 60
+FEED_TTL = 5 * 60
+
+# Maximum number of entries kept in the in-process tier
+LOCAL_MAXSIZE = 512
+
+# Hit/miss/error counters, logged on every lookup
+stats = {"local_hits": 0, "hits": 0, "misses": 0, "errors": 0}
+
+# key -> (expires_at, value), least recently used first
+_local: "OrderedDict[str, tuple]" = OrderedDict()
+_local_lock = threading.Lock()
+
+_client = None
+_client_initialized = False
+
+
+def _get_client():
+    """Create the Redis client on first use; returns None when caching is disabled."""
+    global _client, _client_initialized
+    
+    if not _client_initialized:
+        _client_initialized = True
+        url = os.environ.get("REDIS_URL")
+        if redis is not None and url:
+            try:
+                _client = redis.Redis.from_url(url, socket_timeout=0.5, socket_connect_timeout=0.5)
+            except Exception as e:
+                logger.warning("Redis cache disabled: %s", e)
+                _client = None
+    
+    return _client
+
+
+def _local_get(key: str) -> Optional[Any]:
+    with _local_lock:
+        entry = _local.get(key)
+        if entry is None:
+            return None
+        expires_at, value = entry
+        if expires_at <= time.monotonic():
+            del _local[key]
+            return None
+        _local.move_to_end(key)
+        return value
+
+
+def _local_set(key: str, value: Any, ttl: int) -> None:
+    with _local_lock:
+        _local[key] = (time.monotonic() + ttl, value)
+        _local.move_to_end(key)
+        while len(_local) > LOCAL_MAXSIZE:
+            _local.popitem(last=False)
+
+
+def cache_clear() -> None:
+    """Drop every entry from the in-process tier (e.g. on a manual refresh)."""
+    with _local_lock:
+        _local.clear()
+
+
+def cache_get(key: str) -> Optional[Any]:
+    """
+    Look up a cached value, checking the in-process tier before Redis.
+    
+    Values from the in-process tier are shared between callers and must be
+    treated as read-only.
+    
+    Args:
+        key: Cache key
+    
+    Returns:
+        The cached value, or None on a miss in both tiers
+    """
+    value = _local_get(key)
+    if value is not None:
+        stats["local_hits"] += 1
+        return value
+    
+    client = _get_client()
+    if client is None:
+        return None
+    
+    try:
+        raw = client.get(key)
+        value = pickle.loads(raw) if raw is not None else None
+    except Exception as e:
+        stats["errors"] += 1
+        logger.warning("Redis GET failed for %s: %s", key, e)
+        return None
+    
+    if value is None:
+        stats["misses"] += 1
+        logger.info("cache miss %s (hits=%d misses=%d)", key, stats["hits"], stats["misses"])
+    else:
+        stats["hits"] += 1
+        logger.info("cache hit %s (hits=%d misses=%d)", key, stats["hits"], stats["misses"])
+        # Keep it locally for the remaining lifetime of the Redis entry
+        try:
+            ttl = client.ttl(key)
+        except Exception:
+            ttl = -1
+        if ttl > 0:
+            _local_set(key, value, ttl)
+    
+    return value
+
+
+def cache_set(key: str, value: Any, ttl: int) -> None:
+    """
+    Store a value with an expiry in both tiers.
+    
+    Args:
+        key: Cache key
+        value: Any picklable value (DataFrames included)
+        ttl: Time to live in seconds
+    """
+    _local_set(key, value, ttl)
+    
+    client = _get_client()
+    if client is None:
+        return
+    
+    try:
+        client.set(key, pickle.dumps(value, protocol=pickle.HIGHEST_PROTOCOL), ex=ttl)
+    except Exception as e:
+        stats["errors"] += 1
+        logger.warning("Redis SET failed for %s: %s", key, e)
@@ -11,12 +11,132 @@ Fetches stock data using yfinance including:
 
 import yfinance as yf
 import pandas as pd
-from typing import Dict, Optional, Tuple, List
+from typing import Any, Callable, Dict, Optional, Tuple, List
 from datetime import datetime, timedelta
-import feedparser
-import requests
-from bs4 import BeautifulSoup
+from email.utils import parsedate_tz
 import time
+import threading
+import importlib.util
+from functools import lru_cache
+from concurrent.futures import Future, ThreadPoolExecutor
+
+from cache import cache_get, cache_set, PRICE_TTL, INFO_TTL, FEED_TTL
+
+# Yahoo accepts up to 20 symbols per batched history request
+BATCH_SIZE = 20
+
+
+@lru_cache(maxsize=1)
+def _get_session():
+    """
+    Shared HTTP session for news/RSS requests, so connections are kept alive
+    and reused across fetches; transient errors and rate limits are retried.
+    
+    Created on first use: requests (like feedparser and bs4) is only imported
+    once a news fallback actually runs.
+    """
+    import requests
+    from requests.adapters import HTTPAdapter
+    from urllib3.util.retry import Retry
+    
+    session = requests.Session()
+    session.headers['User-Agent'] = (
+        'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 '
+        '(KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36'
+    )
+    adapter = HTTPAdapter(
+        pool_connections=50,
+        pool_maxsize=50,
+        max_retries=Retry(total=3, backoff_factor=0.5, status_forcelist=[429, 500, 502, 503, 504]),
+    )
+    session.mount('https://', adapter)
+    session.mount('http://', adapter)
+    return session
+
+
+# lxml is optional; BeautifulSoup falls back to the slower built-in parser
+HTML_PARSER = 'lxml' if importlib.util.find_spec('lxml') else 'html.parser'
+
+# News containers and titles on the Yahoo Finance news page
+NEWS_ARTICLE_SELECTOR = ', '.join(
+    f'{tag}[class*="{word}" i]' for tag in ('article', 'div') for word in ('news', 'story')
+)
+NEWS_TITLE_SELECTOR = 'h3[class*="title" i], h2[class*="title" i], span[class*="title" i]'
+
+
+def _parse_feed(url: str):
+    """
+    Download an RSS feed over the shared session and parse it with feedparser.
+    Parsed feeds are cached per URL for FEED_TTL seconds.
+    """
+    cache_key = f"rss:{url}"
+    cached = cache_get(cache_key)
+    if cached is not None:
+        return cached
+    
+    import feedparser
+    
+    response = _get_session().get(url, timeout=10)
+    feed = feedparser.parse(response.content)
+    if feed.entries:
+        cache_set(cache_key, feed, FEED_TTL)
+    return feed
+
+
+# In-flight fetches keyed by cache key, so identical concurrent requests coalesce
+_inflight: Dict[str, Future] = {}
+_inflight_lock = threading.Lock()
+coalesce_stats = {"coalesced_hits": 0}
+
+
+def _coalesced(key: str, fetch: Callable[[], Any]) -> Any:
+    """
+    Run fetch() unless an identical request is already in flight, in which
+    case wait for and return that request's result instead.
+    """
+    with _inflight_lock:
+        future = _inflight.get(key)
+        is_owner = future is None
+        if is_owner:
+            future = Future()
+            _inflight[key] = future
+        else:
+            coalesce_stats["coalesced_hits"] += 1
+    
+    if not is_owner:
+        return future.result()
+    
+    try:
+        result = fetch()
+        future.set_result(result)
+        return result
+    except BaseException as e:
+        future.set_exception(e)
+        raise
+    finally:
+        with _inflight_lock:
+            _inflight.pop(key, None)
+
+
+# symbol -> (created_at, yf.Ticker); at most one live instance per symbol
+_tickers: Dict[str, Tuple[float, yf.Ticker]] = {}
+_tickers_lock = threading.Lock()
+
+
+def _ticker(ticker: str) -> yf.Ticker:
+    """
+    Shared yf.Ticker instance for a symbol, so repeated lookups reuse it.
+    
+    yf.Ticker memoizes info and news on the instance, so an instance older
+    than PRICE_TTL seconds is replaced (and released) on the next lookup.
+    """
+    symbol = ticker.upper()
+    now = time.monotonic()
+    with _tickers_lock:
+        entry = _tickers.get(symbol)
+        if entry is None or now - entry[0] >= PRICE_TTL:
+            entry = _tickers[symbol] = (now, yf.Ticker(symbol))
+    return entry[1]
 
 
 def get_stock_data(ticker: str, period: str = "1y") -> Dict:
@@ -34,10 +154,20 @@ def get_stock_data(ticker: str, period: str = "1y") -> Dict:
         - info: Stock info dictionary
         - recommendations: Analyst recommendations
         - news: Market news
-        - history: Historical price data
     """
+    cache_key = f"sd:{ticker.upper()}:{period}"
+    cached = cache_get(cache_key)
+    if cached is not None:
+        return cached
+    
+    # Concurrent callers for the same ticker/period share a single upstream fetch
+    return _coalesced(cache_key, lambda: _fetch_stock_data(ticker, period, cache_key))
+
+
+def _fetch_stock_data(ticker: str, period: str, cache_key: str) -> Dict:
+    """Fetch stock data from yfinance and cache successful results (see get_stock_data)."""
     try:
-        stock = yf.Ticker(ticker)
+        stock = _ticker(ticker)
         
         # Fetch historical data
         hist = stock.history(period=period)
@@ -45,134 +175,219 @@ def get_stock_data(ticker: str, period: str = "1y") -> Dict:
         if hist.empty:
             return {"error": f"No data found for ticker {ticker}"}
         
-        # Get current info
-        info = stock.info
+        result = _build_stock_data(stock, ticker, hist)
+        cache_set(cache_key, result, PRICE_TTL)
         
-        # Get current price (use last close price if current price unavailable)
-        current_price = hist['Close'].iloc[-1] if not hist.empty else None
+        return result
+    
+    except Exception as e:
+        return {
+            "error": f"Error fetching data for {ticker}: {str(e)}",
+            "success": False
+        }
+
+
+def _build_stock_data(stock: yf.Ticker, ticker: str, hist: pd.DataFrame) -> Dict:
+    """
+    Assemble the get_stock_data() result for a ticker whose history is already fetched.
+    
+    Fetches info, analyst recommendations and news (with RSS/scraping fallbacks).
+    Exceptions from info propagate to the caller; news failures only leave
+    the news list empty.
+    """
+    # info, recommendations and news are independent requests; run them concurrently
+    with ThreadPoolExecutor(max_workers=3) as pool:
+        info_future = pool.submit(lambda: stock.info)
+        recommendations_future = pool.submit(_fetch_recommendations, stock)
+        news_future = pool.submit(_fetch_yfinance_news, stock, ticker)
         
+        # Get current info
+        info = info_future.result()
         # Get analyst recommendations
-        try:
-            recommendations = stock.recommendations
-            if recommendations is not None and not recommendations.empty:
-                recommendations = recommendations.tail(10).to_dict('records')
-            else:
-                recommendations = []
-        except:
+        recommendations = recommendations_future.result()
+        # Get news - try yfinance first (primary source)
+        news = news_future.result()
+    
+    # Get current price (use last close price if current price unavailable)
+    current_price = hist['Close'].iloc[-1] if not hist.empty else None
+    
+    # News is optional; a broken fallback must never fail the whole fetch
+    try:
+        # If no news from yfinance, try RSS feeds as fallback
+        if not news:
+            news = fetch_yahoo_finance_news(ticker)[:10]
+        
+        # If still no news, try web scraping as last resort
+        if not news:
+            news = fetch_stock_news_alternative(ticker, info.get('longName', ''))[:10]
+    except Exception:
+        news = news or []
+    
+    return {
+        "ticker": ticker.upper(),
+        "price_data": hist,
+        "current_price": current_price,
+        "info": info,
+        "recommendations": recommendations,
+        "news": news,
+        "success": True
+    }
+
+
+def _fetch_recommendations(stock: yf.Ticker) -> List[Dict]:
+    """Fetch the 10 most recent analyst recommendations as records."""
+    try:
+        recommendations = stock.recommendations
+        if recommendations is not None and not recommendations.empty:
+            recommendations = recommendations.tail(10).to_dict('records')
+        else:
             recommendations = []
+    except:
+        recommendations = []
+    
+    return recommendations
+
+
+def _fetch_yfinance_news(stock: yf.Ticker, ticker: str) -> List[Dict]:
+    """Fetch and normalize up to 10 news items from yfinance (primary news source)."""
+    try:
+        yf_news = stock.news
+    except Exception:
+        return []
+    
+    news = []
+    for item in (yf_news or [])[:10]:  # Get up to 10 items
+        # yfinance news structure: item['content'] contains the actual news data
+        content = item.get('content') if isinstance(item, dict) else None
+        if not content or not isinstance(content, dict):
+            continue
         
-        # Get news - try multiple sources
-        news = []
+        title = content.get('title')
+        title = title.strip() if isinstance(title, str) else ''
+        if not title:
+            continue
         
-        # Try yfinance news first (primary source)
-        try:
-            yf_news = stock.news
-            if yf_news:
-                for item in yf_news[:10]:  # Get up to 10 items
-                    try:
-                        # yfinance news structure: item['content'] contains the actual news data
-                        content = item.get('content', {})
-                        if not content:
-                            continue
-                        
-                        title = content.get('title', '').strip()
-                        if not title:
-                            continue
-                        
-                        # Extract publisher from provider object
-                        publisher = 'Yahoo Finance'
-                        provider = content.get('provider', {})
-                        if isinstance(provider, dict):
-                            publisher = provider.get('displayName', provider.get('name', 'Yahoo Finance'))
-                        elif isinstance(provider, str):
-                            publisher = provider
-                        
-                        # Extract link from canonicalUrl or clickThroughUrl
-                        link = ''
-                        canonical_url = content.get('canonicalUrl', {})
-                        click_through_url = content.get('clickThroughUrl', {})
-                        
-                        if isinstance(canonical_url, dict) and canonical_url.get('url'):
-                            link = canonical_url['url']
-                        elif isinstance(click_through_url, dict) and click_through_url.get('url'):
-                            link = click_through_url['url']
-                        elif isinstance(canonical_url, str):
-                            link = canonical_url
-                        elif isinstance(click_through_url, str):
-                            link = click_through_url
-                        
-                        if not link:
-                            link = f"https://finance.yahoo.com/quote/{ticker}/news"
-                        
-                        # Extract published date (pubDate is in ISO format: "2025-12-10T18:13:49Z")
-                        published = None
-                        pub_date = content.get('pubDate', '')
-                        if pub_date:
-                            try:
-                                # Try parsing ISO format
-                                if 'T' in pub_date:
-                                    # Remove timezone info if present
-                                    pub_date_clean = pub_date.split('+')[0].split('Z')[0]
-                                    published = datetime.strptime(pub_date_clean, '%Y-%m-%dT%H:%M:%S')
-                                else:
-                                    published = datetime.strptime(pub_date, '%Y-%m-%d')
-                            except:
-                                try:
-                                    # Try timestamp format
-                                    if isinstance(pub_date, (int, float)):
-                                        published = datetime.fromtimestamp(pub_date)
-                                except:
-                                    pass
-                        
-                        news.append({
-                            'title': title,
-                            'publisher': publisher,
-                            'link': link,
-                            'published': published
-                        })
-                    except Exception as e:
-                        continue
-        except Exception as e:
-            pass
+        # Extract publisher from provider object
+        publisher = 'Yahoo Finance'
+        provider = content.get('provider', {})
+        if isinstance(provider, dict):
+            publisher = provider.get('displayName', provider.get('name', 'Yahoo Finance'))
+        elif isinstance(provider, str):
+            publisher = provider
         
-        # If no news from yfinance, try RSS feeds as fallback
-        if not news:
+        # Extract link from canonicalUrl or clickThroughUrl
+        link = ''
+        canonical_url = content.get('canonicalUrl', {})
+        click_through_url = content.get('clickThroughUrl', {})
+        
+        if isinstance(canonical_url, dict) and canonical_url.get('url'):
+            link = canonical_url['url']
+        elif isinstance(click_through_url, dict) and click_through_url.get('url'):
+            link = click_through_url['url']
+        elif isinstance(canonical_url, str):
+            link = canonical_url
+        elif isinstance(click_through_url, str):
+            link = click_through_url
+        
+        if not link:
+            link = f"https://finance.yahoo.com/quote/{ticker}/news"
+        
+        # Extract published date (pubDate is in ISO format: "2025-12-10T18:13:49Z")
+        published = None
+        pub_date = content.get('pubDate', '')
+        if isinstance(pub_date, (int, float)):
+            # Timestamp format
             try:
-                rss_news = fetch_yahoo_finance_news(ticker)
-                if rss_news:
-                    news = rss_news[:10]
-            except:
+                published = datetime.fromtimestamp(pub_date)
+            except (ValueError, OverflowError, OSError):
                 pass
-        
-        # If still no news, try web scraping as last resort
-        if not news:
+        elif isinstance(pub_date, str) and pub_date:
             try:
-                alt_news = fetch_stock_news_alternative(ticker, info.get('longName', ''))
-                if alt_news:
-                    news = alt_news[:10]
-            except:
+                # ISO date or datetime; timezone info is dropped
+                published = datetime.fromisoformat(pub_date.replace('Z', '+00:00')).replace(tzinfo=None)
+            except ValueError:
                 pass
         
-        # Prepare price data
-        price_data = hist.copy()
-        price_data.reset_index(inplace=True)
+        news.append({
+            'title': title,
+            'publisher': publisher,
+            'link': link,
+            'published': published
+        })
+    
+    return news
+
+
+def get_stock_data_batch(tickers: List[str], period: str = "1y") -> Dict[str, Dict]:
+    """
+    Fetch stock data for several tickers, batching the price history requests.
+    
+    History is downloaded with one yf.download() call per group of up to
+    BATCH_SIZE symbols. Info, recommendations and news can't be batched and
+    are fetched per ticker in a small thread pool.
+    
+    yf.download() frames differ from Ticker.history() ones (UTC or naive
+    index, no Dividends/Stock Splits), so results are cached under their
+    own "sdb:" keys rather than get_stock_data()'s "sd:" keys.
+    
+    Args:
+        tickers: Stock ticker symbols
+        period: Time period for historical data (see get_stock_data)
+    
+    Returns:
+        Dictionary mapping each upper-cased ticker to its get_stock_data() result
+    """
+    symbols = list(dict.fromkeys(ticker.upper() for ticker in tickers))
+    results = {}
+    pending = []
+    
+    for ticker in symbols:
+        cached = cache_get(f"sdb:{ticker}:{period}")
+        if cached is not None:
+            results[ticker] = cached
+        else:
+            pending.append(ticker)
+    
+    # Price history in batches
+    histories = {}
+    for i in range(0, len(pending), BATCH_SIZE):
+        group = pending[i:i + BATCH_SIZE]
+        try:
+            df = yf.download(group, period=period, group_by='ticker', threads=True, progress=False)
+        except Exception as e:
+            for ticker in group:
+                results[ticker] = {
+                    "error": f"Error fetching data for {ticker}: {str(e)}",
+                    "success": False
+                }
+            continue
         
-        return {
-            "ticker": ticker.upper(),
-            "price_data": hist,
-            "current_price": current_price,
-            "info": info,
-            "recommendations": recommendations,
-            "news": news,
-            "history": hist,
-            "success": True
-        }
+        downloaded = set(df.columns.get_level_values(0)) if not df.empty else set()
+        for ticker in group:
+            hist = df[ticker].dropna(how='all') if ticker in downloaded else pd.DataFrame()
+            if hist.empty:
+                results[ticker] = {"error": f"No data found for ticker {ticker}"}
+            else:
+                histories[ticker] = hist
     
-    except Exception as e:
-        return {
-            "error": f"Error fetching data for {ticker}: {str(e)}",
-            "success": False
-        }
+    def build(ticker: str) -> Dict:
+        try:
+            result = _build_stock_data(_ticker(ticker), ticker, histories[ticker])
+            cache_set(f"sdb:{ticker}:{period}", result, PRICE_TTL)
+            return result
+        except Exception as e:
+            return {
+                "error": f"Error fetching data for {ticker}: {str(e)}",
+                "success": False
+            }
+    
+    # Everything else per ticker, concurrently
+    if histories:
+        with ThreadPoolExecutor(max_workers=min(8, len(histories))) as pool:
+            for ticker, result in zip(histories, pool.map(build, histories)):
+                results[ticker] = result
+    
+    return {ticker: results[ticker] for ticker in symbols}
 
 
 def get_stock_info(ticker: str) -> Dict:
@@ -185,11 +400,16 @@ def get_stock_info(ticker: str) -> Dict:
     Returns:
         Dictionary with stock info
     """
+    cache_key = f"si:{ticker.upper()}"
+    cached = cache_get(cache_key)
+    if cached is not None:
+        return cached
+    
     try:
-        stock = yf.Ticker(ticker)
+        stock = _ticker(ticker)
         info = stock.info
         
-        return {
+        result = {
             "ticker": ticker.upper(),
             "name": info.get('longName', ticker),
             "sector": info.get('sector', 'N/A'),
@@ -201,6 +421,9 @@ def get_stock_info(ticker: str) -> Dict:
             "52_week_low": info.get('fiftyTwoWeekLow', None),
             "success": True
         }
+        cache_set(cache_key, result, INFO_TTL)
+        
+        return result
     except Exception as e:
         return {
             "error": f"Error fetching info for {ticker}: {str(e)}",
@@ -208,6 +431,30 @@ def get_stock_info(ticker: str) -> Dict:
         }
 
 
+def _entry_published(entry) -> Optional[datetime]:
+    """Published date of a feedparser entry as a naive UTC datetime, if it has one."""
+    try:
+        if entry.get('published_parsed'):
+            return datetime(*entry.published_parsed[:6])
+        
+        # feedparser could not parse the date itself; try plain RFC 822
+        parsed = parsedate_tz(entry.get('published', ''))
+        if parsed is None:
+            return None
+        return datetime(*parsed[:6]) - timedelta(seconds=parsed[9] or 0)
+    except (ValueError, OverflowError):
+        # Out-of-range fields such as "32 Jan"; keep the entry, drop the date
+        return None
+
+
+def _entry_publisher(entry, default: str) -> str:
+    """Publisher of a feedparser entry, taken from its <source> element."""
+    source = entry.get('source')
+    if not source:
+        return default
+    return source.get('title', default) if isinstance(source, dict) else str(source)
+
+
 def fetch_yahoo_finance_news(ticker: str) -> List[Dict]:
     """
     Fetch news from Yahoo Finance RSS feed and Google News.
@@ -218,89 +465,44 @@ def fetch_yahoo_finance_news(ticker: str) -> List[Dict]:
     Returns:
         List of news dictionaries
     """
-    news_items = []
+    search_query = f"{ticker} stock news"
     
-    # Try multiple Yahoo Finance RSS feed formats
-    rss_urls = [
-        f"https://feeds.finance.yahoo.com/rss/2.0/headline?s={ticker}&region=US&lang=en-US",
-        f"https://finance.yahoo.com/rss/headline?s={ticker}",
+    # Multiple Yahoo Finance RSS feed formats, then Google News RSS, in order
+    # of preference; all are requested at once so slow feeds overlap
+    feeds = [
+        (f"https://feeds.finance.yahoo.com/rss/2.0/headline?s={ticker}&region=US&lang=en-US", 'Yahoo Finance'),
+        (f"https://finance.yahoo.com/rss/headline?s={ticker}", 'Yahoo Finance'),
+        (f"https://news.google.com/rss/search?q={search_query}&hl=en-US&gl=US&ceid=US:en", 'Google News'),
     ]
     
-    for rss_url in rss_urls:
-        try:
-            feed = feedparser.parse(rss_url)
-            
-            if feed.entries:
-                for entry in feed.entries[:10]:
-                    try:
-                        # Parse published date
-                        published = None
-                        if hasattr(entry, 'published_parsed') and entry.published_parsed:
-                            published = datetime(*entry.published_parsed[:6])
-                        elif hasattr(entry, 'published'):
-                            try:
-                                published = datetime.strptime(entry.published, '%a, %d %b %Y %H:%M:%S %z')
-                            except:
-                                try:
-                                    published = datetime.strptime(entry.published, '%a, %d %b %Y %H:%M:%S %Z')
-                                except:
-                                    pass
-                        
-                        title = entry.get('title', '').strip()
-                        link = entry.get('link', '').strip()
-                        
-                        if title and link:
-                            publisher = 'Yahoo Finance'
-                            if hasattr(entry, 'source') and entry.source:
-                                publisher = entry.source.get('title', 'Yahoo Finance') if isinstance(entry.source, dict) else str(entry.source)
-                            
-                            news_items.append({
-                                'title': title,
-                                'publisher': publisher,
-                                'link': link,
-                                'published': published
-                            })
-                    except Exception as e:
-                        continue
-                
-                if news_items:  # If we got results, break
-                    break
-        except Exception as e:
-            continue
+    pool = ThreadPoolExecutor(max_workers=len(feeds))
+    futures = [(pool.submit(_parse_feed, url), publisher) for url, publisher in feeds]
     
-    # If no Yahoo Finance news, try Google News RSS
-    if not news_items:
-        try:
-            search_query = f"{ticker} stock news"
-            google_news_url = f"https://news.google.com/rss/search?q={search_query}&hl=en-US&gl=US&ceid=US:en"
+    news_items = []
+    try:
+        for future, default_publisher in futures:
+            try:
+                feed = future.result()
+            except Exception:
+                continue
             
-            feed = feedparser.parse(google_news_url)
+            for entry in feed.entries[:10]:
+                title = entry.get('title', '').strip()
+                link = entry.get('link', '').strip()
+                
+                if title and link:
+                    news_items.append({
+                        'title': title,
+                        'publisher': _entry_publisher(entry, default_publisher),
+                        'link': link,
+                        'published': _entry_published(entry)
+                    })
             
-            if feed.entries:
-                for entry in feed.entries[:10]:
-                    try:
-                        published = None
-                        if hasattr(entry, 'published_parsed') and entry.published_parsed:
-                            published = datetime(*entry.published_parsed[:6])
-                        
-                        title = entry.get('title', '').strip()
-                        link = entry.get('link', '').strip()
-                        
-                        if title and link:
-                            publisher = 'Google News'
-                            if hasattr(entry, 'source') and entry.source:
-                                publisher = entry.source.get('title', 'Google News') if isinstance(entry.source, dict) else str(entry.source)
-                            
-                            news_items.append({
-                                'title': title,
-                                'publisher': publisher,
-                                'link': link,
-                                'published': published
-                            })
-                    except:
-                        continue
-        except:
-            pass
+            if news_items:  # First feed with results wins
+                break
+    finally:
+        # Don't wait on lower-priority feeds once a result is in
+        pool.shutdown(wait=False, cancel_futures=True)
     
     return news_items
 
@@ -318,77 +520,69 @@ def fetch_stock_news_alternative(ticker: str, company_name: str = "") -> List[Di
     """
     news_items = []
     
+    # Try Yahoo Finance news page
+    url = f"https://finance.yahoo.com/quote/{ticker}/news"
+    
     try:
-        # Try Yahoo Finance news page
-        url = f"https://finance.yahoo.com/quote/{ticker}/news"
-        
-        headers = {
-            'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36'
-        }
-        
-        response = requests.get(url, headers=headers, timeout=10)
-        
-        if response.status_code == 200:
-            soup = BeautifulSoup(response.content, 'html.parser')
+        response = _get_session().get(url, timeout=10)
+    except Exception:
+        response = None
+    
+    articles = []
+    if response is not None and response.status_code == 200:
+        try:
+            from bs4 import BeautifulSoup
+            
+            soup = BeautifulSoup(response.content, HTML_PARSER)
             
             # Look for news articles in the page
             # Yahoo Finance uses various selectors, try common ones
-            articles = soup.find_all(['article', 'div'], class_=lambda x: x and ('news' in x.lower() or 'story' in x.lower()))
+            articles = soup.select(NEWS_ARTICLE_SELECTOR)
             
             if not articles:
                 # Try alternative selectors
-                articles = soup.find_all('h3', class_=lambda x: x and 'Mb(5px)' in str(x))
+                articles = soup.select('h3[class*="Mb(5px)"]')
+        except Exception:
+            # Unparseable page or bs4 missing; fall through to Google News
+            articles = []
+    
+    for article in articles[:10]:
+        # Extract title and link
+        link_elem = article.find('a', href=True)
+        title_elem = article.select_one(NEWS_TITLE_SELECTOR) or article.find('a')
+        
+        if link_elem:
+            link = link_elem.get('href', '')
+            if link and not link.startswith('http'):
+                link = f"https://finance.yahoo.com{link}"
             
-            for article in articles[:10]:
-                try:
-                    # Extract title and link
-                    link_elem = article.find('a', href=True)
-                    title_elem = article.find(['h3', 'h2', 'span'], class_=lambda x: x and 'title' in str(x).lower()) or article.find('a')
-                    
-                    if link_elem:
-                        link = link_elem.get('href', '')
-                        if link and not link.startswith('http'):
-                            link = f"https://finance.yahoo.com{link}"
-                        
-                        title = title_elem.get_text(strip=True) if title_elem else link_elem.get_text(strip=True)
-                        
-                        if title and link:
-                            news_items.append({
-                                'title': title,
-                                'publisher': 'Yahoo Finance',
-                                'link': link,
-                                'published': None  # Date parsing from HTML is complex
-                            })
-                except:
-                    continue
-    except Exception as e:
-        pass
+            title = title_elem.get_text(strip=True) if title_elem else link_elem.get_text(strip=True)
+            
+            if title and link:
+                news_items.append({
+                    'title': title,
+                    'publisher': 'Yahoo Finance',
+                    'link': link,
+                    'published': None  # Date parsing from HTML is complex
+                })
     
     # If still no news, try Google News RSS (as fallback)
     if not news_items:
+        search_query = f"{ticker} stock" if not company_name else f"{company_name} {ticker}"
+        google_news_url = f"https://news.google.com/rss/search?q={search_query}&hl=en-US&gl=US&ceid=US:en"
+        
         try:
-            search_query = f"{ticker} stock" if not company_name else f"{company_name} {ticker}"
-            google_news_url = f"https://news.google.com/rss/search?q={search_query}&hl=en-US&gl=US&ceid=US:en"
-            
-            feed = feedparser.parse(google_news_url)
-            
-            if feed.entries:
-                for entry in feed.entries[:10]:
-                    try:
-                        published = None
-                        if hasattr(entry, 'published_parsed') and entry.published_parsed:
-                            published = datetime(*entry.published_parsed[:6])
-                        
-                        news_items.append({
-                            'title': entry.get('title', ''),
-                            'publisher': entry.get('source', {}).get('title', 'Google News') if hasattr(entry, 'source') else 'Google News',
-                            'link': entry.get('link', ''),
-                            'published': published
-                        })
-                    except:
-                        continue
-        except:
-            pass
+            feed = _parse_feed(google_news_url)
+        except Exception:
+            return news_items
+        
+        for entry in feed.entries[:10]:
+            news_items.append({
+                'title': entry.get('title', ''),
+                'publisher': _entry_publisher(entry, 'Google News'),
+                'link': entry.get('link', ''),
+                'published': _entry_published(entry)
+            })
     
     return news_items
 
@@ -405,17 +599,24 @@ def search_stock(query: str) -> list:
     Returns:
         List of matching tickers
     """
+    cache_key = f"ss:{query.upper()}"
+    cached = cache_get(cache_key)
+    if cached is not None:
+        return cached
+    
     # Simple validation - try to fetch the ticker
     # In production, integrate with a proper search API
     try:
-        stock = yf.Ticker(query.upper())
+        stock = _ticker(query)
         info = stock.info
         if info and 'symbol' in info:
-            return [{
+            result = [{
                 "ticker": query.upper(),
                 "name": info.get('longName', query.upper()),
                 "exchange": info.get('exchange', 'N/A')
             }]
+            cache_set(cache_key, result, INFO_TTL)
+            return result
     except:
         pass
     
@@ -8,9 +8,33 @@ Helper functions for calculating:
 - Price momentum
 """
 
+import hashlib
+import importlib.util
+import os
+import time
+from pathlib import Path
+
 import pandas as pd
 import numpy as np
-from typing import Dict, Optional
+from numpy.lib.stride_tricks import sliding_window_view
+from typing import Dict, Optional, Tuple
+
+from cache import PRICE_TTL
+
+# Shared numba shim: other modules import njit / HAS_NUMBA from here
+try:
+    from numba import njit
+    HAS_NUMBA = True
+except ImportError:  # numba is optional; njit becomes a no-op and kernels run as plain Python
+    HAS_NUMBA = False
+    
+    def njit(*args, **kwargs):
+        return lambda func: func
+
+# On-disk indicator cache (parquet), used when a ticker and period are given
+# and a parquet engine is installed; entries expire with the price cache
+INDICATOR_CACHE_DIR = Path(os.environ.get('INDICATOR_CACHE_DIR', '.cache'))
+HAS_PARQUET = any(importlib.util.find_spec(engine) for engine in ('pyarrow', 'fastparquet'))
 
 
 def calculate_sma(data: pd.Series, window: int) -> pd.Series:
@@ -43,23 +67,42 @@ def calculate_ema(data: pd.Series, window: int) -> pd.Series:
 
 def calculate_rsi(data: pd.Series, window: int = 14) -> pd.Series:
     """
-    Calculate Relative Strength Index (RSI).
+    Calculate Relative Strength Index (RSI) with Wilder's smoothing.
     
     Args:
         data: Price series (typically Close prices)
         window: Number of periods for RSI calculation (default 14)
     
     Returns:
-        Series with RSI values (0-100)
+        Series with RSI values (0-100), NaN until `window` price changes are available
     """
-    delta = data.diff()
-    gain = (delta.where(delta > 0, 0)).rolling(window=window).mean()
-    loss = (-delta.where(delta < 0, 0)).rolling(window=window).mean()
+    arr = data.to_numpy(dtype=np.float64)
+    delta = np.full_like(arr, np.nan)
+    delta[1:] = np.diff(arr)
     
-    rs = gain / loss
-    rsi = 100 - (100 / (1 + rs))
+    return pd.Series(_wilder_rsi(delta, window), index=data.index, name=data.name)
+
+
+def _wilder_rsi(delta: np.ndarray, window: int) -> np.ndarray:
+    """
+    Wilder-smoothed RSI from an array of price changes (delta[0] is NaN).
+    """
+    gain = np.clip(delta, 0.0, None)
+    loss = np.clip(-delta, 0.0, None)
     
-    return rsi
+    # Wilder's smoothing: seed with the simple average of the first `window`
+    # changes, then recurse as an EMA with alpha = 1 / window
+    if len(delta) > window:
+        gain[window] = gain[1:window + 1].mean()
+        loss[window] = loss[1:window + 1].mean()
+    gain[:window] = np.nan
+    loss[:window] = np.nan
+    avg_gain = pd.Series(gain).ewm(alpha=1 / window, adjust=False).mean().to_numpy()
+    avg_loss = pd.Series(loss).ewm(alpha=1 / window, adjust=False).mean().to_numpy()
+    
+    with np.errstate(divide='ignore', invalid='ignore'):
+        rs = avg_gain / avg_loss
+        return 100 - (100 / (1 + rs))
 
 
 def calculate_volatility(data: pd.Series, window: int = 20) -> pd.Series:
@@ -73,9 +116,30 @@ def calculate_volatility(data: pd.Series, window: int = 20) -> pd.Series:
     Returns:
         Series with volatility values
     """
-    returns = data.pct_change()
-    volatility = returns.rolling(window=window).std() * np.sqrt(252) * 100  # Annualized %
-    return volatility
+    arr = data.to_numpy(dtype=np.float64)
+    volatility = np.full(len(arr), np.nan)
+    volatility[1:] = _rolling_std(arr[1:] / arr[:-1] - 1, window) * np.sqrt(252) * 100  # Annualized %
+    return pd.Series(volatility, index=data.index, name=data.name)
+
+
+def _rolling_mean(values: np.ndarray, window: int) -> np.ndarray:
+    """
+    Trailing rolling mean over a zero-copy window view; NaN until a full window.
+    """
+    out = np.full(len(values), np.nan)
+    if len(values) >= window:
+        out[window - 1:] = sliding_window_view(values, window).mean(axis=1)
+    return out
+
+
+def _rolling_std(values: np.ndarray, window: int) -> np.ndarray:
+    """
+    Trailing rolling sample std (ddof=1) over a zero-copy window view.
+    """
+    out = np.full(len(values), np.nan)
+    if len(values) >= window:
+        out[window - 1:] = sliding_window_view(values, window).std(axis=1, ddof=1)
+    return out
 
 
 def calculate_momentum(data: pd.Series, window: int = 10) -> pd.Series:
@@ -93,42 +157,290 @@ def calculate_momentum(data: pd.Series, window: int = 10) -> pd.Series:
     return momentum
 
 
-def calculate_all_indicators(price_data: pd.DataFrame) -> Dict:
+@njit(cache=True)
+def _indicators_kernel(close, volume):
+    """
+    Compute every indicator used by calculate_all_indicators in one sweep.
+    
+    Mirrors the pandas helpers above (same windows, warm-up NaNs and Wilder
+    seeding) so both paths give the same numbers. Expects a NaN-free close.
+    
+    Args:
+        close: float64 array of Close prices
+        volume: float64 array of volumes (may be empty)
+    
+    Returns:
+        Tuple of arrays: sma_20, sma_50, sma_200, ema_12, ema_26, rsi,
+        volatility, momentum, volume_avg
+    """
+    n = close.shape[0]
+    sma_20 = np.full(n, np.nan)
+    sma_50 = np.full(n, np.nan)
+    sma_200 = np.full(n, np.nan)
+    ema_12 = np.empty(n)
+    ema_26 = np.empty(n)
+    rsi = np.full(n, np.nan)
+    volatility = np.full(n, np.nan)
+    momentum = np.full(n, np.nan)
+    volume_avg = np.full(volume.shape[0], np.nan)
+    
+    alpha_12 = 2.0 / 13.0
+    alpha_26 = 2.0 / 27.0
+    sum_20 = 0.0
+    sum_50 = 0.0
+    sum_200 = 0.0
+    sum_vol = 0.0
+    # Running sums of returns and squared returns for the 20-period std
+    ret_sum = 0.0
+    ret_sq = 0.0
+    rets = np.zeros(n)
+    avg_gain = 0.0
+    avg_loss = 0.0
+    
+    for i in range(n):
+        price = close[i]
+        
+        sum_20 += price
+        sum_50 += price
+        sum_200 += price
+        if i >= 20:
+            sum_20 -= close[i - 20]
+        if i >= 50:
+            sum_50 -= close[i - 50]
+        if i >= 200:
+            sum_200 -= close[i - 200]
+        if i >= 19:
+            sma_20[i] = sum_20 / 20
+        if i >= 49:
+            sma_50[i] = sum_50 / 50
+        if i >= 199:
+            sma_200[i] = sum_200 / 200
+        
+        if i == 0:
+            ema_12[i] = price
+            ema_26[i] = price
+        else:
+            ema_12[i] = alpha_12 * price + (1 - alpha_12) * ema_12[i - 1]
+            ema_26[i] = alpha_26 * price + (1 - alpha_26) * ema_26[i - 1]
+        
+        if i >= 10:
+            momentum[i] = (price / close[i - 10] - 1) * 100
+        
+        if i < volume.shape[0]:
+            sum_vol += volume[i]
+            if i >= 20:
+                sum_vol -= volume[i - 20]
+            if i >= 19:
+                volume_avg[i] = sum_vol / 20
+        
+        if i == 0:
+            continue
+        
+        # Wilder RSI: simple average of the first 14 changes, then alpha = 1/14
+        change = price - close[i - 1]
+        gain = change if change > 0 else 0.0
+        loss = -change if change < 0 else 0.0
+        if i <= 14:
+            avg_gain += gain / 14
+            avg_loss += loss / 14
+        else:
+            avg_gain += (gain - avg_gain) / 14
+            avg_loss += (loss - avg_loss) / 14
+        if i >= 14:
+            if avg_loss == 0:
+                rsi[i] = 100.0 if avg_gain > 0 else np.nan
+            else:
+                rsi[i] = 100 - 100 / (1 + avg_gain / avg_loss)
+        
+        # Annualized volatility of simple returns, sample std (ddof=1)
+        ret = price / close[i - 1] - 1
+        rets[i] = ret
+        ret_sum += ret
+        ret_sq += ret * ret
+        if i > 20:
+            old = rets[i - 20]
+            ret_sum -= old
+            ret_sq -= old * old
+        if i >= 20:
+            var = (ret_sq - ret_sum * ret_sum / 20) / 19
+            volatility[i] = np.sqrt(max(var, 0.0)) * np.sqrt(252.0) * 100
+    
+    return sma_20, sma_50, sma_200, ema_12, ema_26, rsi, volatility, momentum, volume_avg
+
+
+def _indicators_numpy(close: np.ndarray, volume: np.ndarray) -> Tuple[np.ndarray, ...]:
+    """
+    NumPy equivalent of _indicators_kernel for installs without numba.
+    
+    Close is read once into a cumulative sum (for every SMA) and one array of
+    price changes (shared by RSI and volatility) instead of once per helper.
+    """
+    n = len(close)
+    cs = np.concatenate(([0.0], np.cumsum(close)))
+    
+    def sma(window: int) -> np.ndarray:
+        out = np.full(n, np.nan)
+        if n >= window:
+            out[window - 1:] = (cs[window:] - cs[:-window]) / window
+        return out
+    
+    delta = np.full(n, np.nan)
+    delta[1:] = np.diff(close)
+    volatility = np.full(n, np.nan)
+    volatility[1:] = _rolling_std(delta[1:] / close[:-1], 20) * np.sqrt(252) * 100
+    
+    momentum = np.full(n, np.nan)
+    momentum[10:] = (close[10:] / close[:-10] - 1) * 100
+    
+    ema_12 = pd.Series(close).ewm(span=12, adjust=False).mean().to_numpy()
+    ema_26 = pd.Series(close).ewm(span=26, adjust=False).mean().to_numpy()
+    volume_avg = _rolling_mean(volume, 20)
+    
+    return (sma(20), sma(50), sma(200), ema_12, ema_26, _wilder_rsi(delta, 14),
+            volatility, momentum, volume_avg)
+
+
+def _value_at(values: Optional[np.ndarray], position: int) -> Optional[float]:
+    """
+    Value at `position` (e.g. -1 for latest) as a float, or None if missing or NaN.
+    """
+    if values is None or len(values) < -position:
+        return None
+    value = float(values[position])
+    return None if np.isnan(value) else value
+
+
+def _indicator_cache_path(ticker: str, period: str, price_data: pd.DataFrame,
+                          close_values: np.ndarray) -> Path:
+    """
+    Cache file for a ticker/period, keyed on the last bar, the number of bars
+    and the last close, so an intraday update of today's bar misses the cache.
+    """
+    fingerprint = f"{price_data.index[-1]}|{len(price_data)}|{float(close_values[-1]).hex()}"
+    digest = hashlib.blake2b(fingerprint.encode(), digest_size=8).hexdigest()
+    return INDICATOR_CACHE_DIR / ticker.upper() / f"{period}_{digest}_ind.parquet"
+
+
+def _read_indicator_cache(path: Path, index: pd.Index) -> Optional[pd.DataFrame]:
+    """
+    Load cached indicators from `path`, or None if missing, expired or not
+    aligned with `index`.
+    """
+    try:
+        if time.time() - path.stat().st_mtime > PRICE_TTL:
+            return None
+        indicators = pd.read_parquet(path)
+    except Exception:
+        return None
+    return indicators if indicators.index.equals(index) else None
+
+
+def _write_indicator_cache(path: Path, indicators: pd.DataFrame) -> None:
+    """
+    Store the indicator frame as parquet; failures only skip caching.
+    """
+    tmp_path = path.with_name(f"{path.name}.{os.getpid()}.tmp")
+    try:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        indicators.to_parquet(tmp_path, compression='snappy')
+        os.replace(tmp_path, path)  # atomic, so concurrent scans never read partial files
+    except Exception:
+        tmp_path.unlink(missing_ok=True)
+        return
+    
+    # Only the newest file per ticker and period is ever read again
+    period = path.name.split('_', 1)[0]
+    for old_path in path.parent.glob(f"{period}_*_ind.parquet"):
+        if old_path != path:
+            try:
+                old_path.unlink(missing_ok=True)
+            except OSError:
+                pass
+
+
+def _compute_indicators(close: pd.Series, close_values: np.ndarray, volume_values: np.ndarray,
+                        has_volume: bool) -> pd.DataFrame:
+    """
+    Indicator columns for calculate_all_indicators, sharing the price index
+    (no volume_avg column without volume).
+    
+    Computed in float64, stored as float32: ~7 significant digits is plenty
+    for prices and percentages and halves the frame (and cache file) size.
+    """
+    # The fused paths assume gap-free input; pandas handles NaN windows otherwise
+    if not (np.isnan(close_values).any() or np.isnan(volume_values).any()):
+        kernel = _indicators_kernel if HAS_NUMBA else _indicators_numpy
+        outputs = kernel(close_values, volume_values)
+        names = ['sma_20', 'sma_50', 'sma_200', 'ema_12', 'ema_26', 'rsi', 'volatility', 'momentum', 'volume_avg']
+        columns = {name: values for name, values in zip(names, outputs) if len(values)}
+    else:
+        columns = {
+            'sma_20': calculate_sma(close, 20).to_numpy(),
+            'sma_50': calculate_sma(close, 50).to_numpy(),
+            'sma_200': calculate_sma(close, 200).to_numpy(),
+            'ema_12': calculate_ema(close, 12).to_numpy(),
+            'ema_26': calculate_ema(close, 26).to_numpy(),
+            'rsi': calculate_rsi(close, 14).to_numpy(),
+            'volatility': calculate_volatility(close, 20).to_numpy(),
+            'momentum': calculate_momentum(close, 10).to_numpy(),
+        }
+        if has_volume:
+            columns['volume_avg'] = _rolling_mean(volume_values, 20)
+    
+    return pd.DataFrame(columns, index=close.index, dtype=np.float32)
+
+
+def calculate_all_indicators(price_data: pd.DataFrame, ticker: Optional[str] = None,
+                             period: Optional[str] = None) -> Dict:
     """
     Calculate all technical indicators for a stock.
     
     Args:
         price_data: DataFrame with OHLCV data (must have 'Close' column)
+        ticker: Stock ticker symbol; with `period`, enables the on-disk cache
+        period: Time period the price data was fetched for
     
     Returns:
-        Dictionary containing all calculated indicators
+        Dictionary with 'indicators' (float32 DataFrame of indicator columns
+        on the price index), 'latest' (scalar values) and 'success'
     """
     if price_data.empty or 'Close' not in price_data.columns:
         return {"error": "Invalid price data"}
     
     close = price_data['Close']
+    close_values = close.to_numpy(dtype=np.float64)
     
-    indicators = {
-        'sma_20': calculate_sma(close, 20),
-        'sma_50': calculate_sma(close, 50),
-        'sma_200': calculate_sma(close, 200),
-        'ema_12': calculate_ema(close, 12),
-        'ema_26': calculate_ema(close, 26),
-        'rsi': calculate_rsi(close, 14),
-        'volatility': calculate_volatility(close, 20),
-        'momentum': calculate_momentum(close, 10),
-        'volume_avg': price_data['Volume'].rolling(window=20).mean() if 'Volume' in price_data.columns else None
-    }
+    has_volume = 'Volume' in price_data.columns
+    volume_values = price_data['Volume'].to_numpy(dtype=np.float64) if has_volume else np.empty(0)
+    
+    # Reuse indicators computed for the same ticker, period and price history
+    cache_path = None
+    if ticker and period and HAS_PARQUET:
+        cache_path = _indicator_cache_path(ticker, period, price_data, close_values)
+    
+    indicators = _read_indicator_cache(cache_path, close.index) if cache_path else None
+    if indicators is None:
+        indicators = _compute_indicators(close, close_values, volume_values, has_volume)
+        if cache_path:
+            _write_indicator_cache(cache_path, indicators)
     
-    # Get latest values
+    # Get latest values, plus the previous bar and volume figures the
+    # signal engine compares against, so it never has to re-slice Series
+    values = {name: indicators[name].to_numpy() for name in indicators.columns}
     latest = {
-        'current_price': close.iloc[-1],
-        'sma_20': indicators['sma_20'].iloc[-1] if not pd.isna(indicators['sma_20'].iloc[-1]) else None,
-        'sma_50': indicators['sma_50'].iloc[-1] if not pd.isna(indicators['sma_50'].iloc[-1]) else None,
-        'sma_200': indicators['sma_200'].iloc[-1] if not pd.isna(indicators['sma_200'].iloc[-1]) else None,
-        'rsi': indicators['rsi'].iloc[-1] if not pd.isna(indicators['rsi'].iloc[-1]) else None,
-        'volatility': indicators['volatility'].iloc[-1] if not pd.isna(indicators['volatility'].iloc[-1]) else None,
-        'momentum': indicators['momentum'].iloc[-1] if not pd.isna(indicators['momentum'].iloc[-1]) else None,
+        'current_price': float(close_values[-1]),
+        'sma_20': _value_at(values['sma_20'], -1),
+        'sma_50': _value_at(values['sma_50'], -1),
+        'sma_200': _value_at(values['sma_200'], -1),
+        'rsi': _value_at(values['rsi'], -1),
+        'volatility': _value_at(values['volatility'], -1),
+        'momentum': _value_at(values['momentum'], -1),
+        'prev_close': float(close_values[-2] if len(close_values) >= 2 else close_values[-1]),
+        'prev_sma_20': _value_at(values['sma_20'], -2),
+        'prev_sma_50': _value_at(values['sma_50'], -2),
+        'prev_sma_200': _value_at(values['sma_200'], -2),
+        'current_volume': _value_at(volume_values, -1) if has_volume else None,
+        'avg_volume': _value_at(values.get('volume_avg'), -1),
     }
     
     return {
@@ -0,0 +1,89 @@
+"""
+Ticker Scanner Module
+Runs the full analysis pipeline over many tickers for screener-style workloads:
+- Batched data fetching
+- Indicators and short/long-term signals computed in parallel processes
+"""
+
+import logging
+import multiprocessing as mp
+import os
+from typing import Dict, List
+
+import pandas as pd
+
+from data_fetcher import get_stock_data_batch
+from indicators import calculate_all_indicators
+from signal_engine import generate_short_term_signal, generate_long_term_signal
+
+
+logger = logging.getLogger(__name__)
+
+
+def _process_ticker(ticker: str, period: str, price_data: pd.DataFrame, recommendations: List) -> Dict:
+    """
+    Compute indicators and signals for one ticker.
+    
+    Must stay at module level so multiprocessing can pickle it.
+    """
+    indicators = calculate_all_indicators(price_data, ticker, period)
+    if not indicators.get('success', False):
+        return {"error": f"Failed to calculate indicators for {ticker}", "success": False}
+    
+    short_signal, short_reason = generate_short_term_signal(indicators, price_data)
+    long_signal, long_reason = generate_long_term_signal(indicators, price_data, recommendations)
+    
+    return {
+        "ticker": ticker,
+        "latest": indicators['latest'],
+        "short_term_signal": short_signal,
+        "short_term_reason": short_reason,
+        "long_term_signal": long_signal,
+        "long_term_reason": long_reason,
+        "success": True
+    }
+
+
+def scan_tickers(tickers: List[str], period: str = "1y", processes: int = None) -> Dict[str, Dict]:
+    """
+    Fetch data and generate signals for many tickers.
+    
+    Fetching is I/O-bound and batched in this process; the CPU-bound
+    indicator and signal work is spread across a process pool.
+    
+    Args:
+        tickers: Stock ticker symbols
+        period: Time period for historical data
+        processes: Worker processes (default: one per CPU, capped at the ticker count)
+    
+    Returns:
+        Dictionary mapping each upper-cased ticker to its scan result or error
+    """
+    stock_data = get_stock_data_batch(tickers, period)
+    
+    results = {}
+    fetched = {}
+    for ticker, data in stock_data.items():
+        if data.get('success', False):
+            fetched[ticker] = data
+        else:
+            results[ticker] = {"error": data.get('error', 'Failed to fetch stock data'), "success": False}
+    
+    if fetched:
+        processes = processes or min(len(fetched), os.cpu_count() or 1)
+        with mp.Pool(processes) as pool:
+            pending = {
+                ticker: pool.apply_async(
+                    _process_ticker,
+                    (ticker, period, data['price_data'], data.get('recommendations', [])),
+                    error_callback=lambda e: logger.error("Ticker scan failed: %s", e)
+                )
+                for ticker, data in fetched.items()
+            }
+            for ticker, async_result in pending.items():
+                try:
+                    results[ticker] = async_result.get()
+                except Exception as e:
+                    results[ticker] = {"error": f"Error scanning {ticker}: {str(e)}", "success": False}
+    
+    return {ticker: results[ticker] for ticker in stock_data}
@@ -9,6 +9,8 @@ from typing import Dict, Tuple
 import pandas as pd
 import numpy as np
 
+from trend_analysis import BUY_GRADES, SELL_GRADES
+
 
 def generate_short_term_signal(indicators: Dict, price_data: pd.DataFrame) -> Tuple[str, str]:
     """
@@ -33,7 +35,6 @@ def generate_short_term_signal(indicators: Dict, price_data: pd.DataFrame) -> Tu
         return "HOLD", "Insufficient data for analysis"
     
     latest = indicators.get('latest', {})
-    indicator_series = indicators.get('indicators', {})
     
     current_price = latest.get('current_price', 0)
     rsi = latest.get('rsi')
@@ -61,24 +62,23 @@ def generate_short_term_signal(indicators: Dict, price_data: pd.DataFrame) -> Tu
     
     # Price vs SMA20 Analysis
     if sma_20 is not None and current_price > 0:
-        sma_20_series = indicator_series.get('sma_20', pd.Series())
-        if not sma_20_series.empty and len(sma_20_series) >= 2:
-            # Check if price crossed above SMA20
-            prev_price = price_data['Close'].iloc[-2] if len(price_data) >= 2 else current_price
-            prev_sma20 = sma_20_series.iloc[-2] if len(sma_20_series) >= 2 else sma_20
-            
-            if prev_price <= prev_sma20 and current_price > sma_20:
-                buy_score += 2
-                reasons.append("Price crossed above SMA20 (bullish breakout)")
-            elif prev_price >= prev_sma20 and current_price < sma_20:
-                sell_score += 2
-                reasons.append("Price crossed below SMA20 (bearish breakdown)")
-            elif current_price > sma_20 * 1.02:
-                buy_score += 1
-                reasons.append("Price significantly above SMA20")
-            elif current_price < sma_20 * 0.98:
-                sell_score += 1
-                reasons.append("Price significantly below SMA20")
+        # Check if price crossed SMA20 since the previous bar
+        prev_price = latest.get('prev_close', current_price)
+        prev_sma20 = latest.get('prev_sma_20')
+        has_prev = prev_sma20 is not None
+        
+        if has_prev and prev_price <= prev_sma20 and current_price > sma_20:
+            buy_score += 2
+            reasons.append("Price crossed above SMA20 (bullish breakout)")
+        elif has_prev and prev_price >= prev_sma20 and current_price < sma_20:
+            sell_score += 2
+            reasons.append("Price crossed below SMA20 (bearish breakdown)")
+        elif current_price > sma_20 * 1.02:
+            buy_score += 1
+            reasons.append("Price significantly above SMA20")
+        elif current_price < sma_20 * 0.98:
+            sell_score += 1
+            reasons.append("Price significantly below SMA20")
     
     # Momentum Analysis
     if momentum is not None:
@@ -90,11 +90,10 @@ def generate_short_term_signal(indicators: Dict, price_data: pd.DataFrame) -> Tu
             reasons.append(f"Strong negative momentum ({momentum:.1f}%)")
     
     # Volume Analysis
-    volume_avg = indicator_series.get('volume_avg')
-    if volume_avg is not None and not volume_avg.empty and 'Volume' in price_data.columns:
-        current_volume = price_data['Volume'].iloc[-1]
-        avg_volume = volume_avg.iloc[-1]
-        if not pd.isna(avg_volume) and avg_volume > 0:
+    current_volume = latest.get('current_volume')
+    avg_volume = latest.get('avg_volume')
+    if current_volume is not None and avg_volume is not None:
+        if avg_volume > 0:
             volume_ratio = current_volume / avg_volume
             if volume_ratio > 1.5:
                 if buy_score > sell_score:
@@ -137,7 +136,6 @@ def generate_long_term_signal(indicators: Dict, price_data: pd.DataFrame, recomm
         return "HOLD", "Insufficient data for analysis"
     
     latest = indicators.get('latest', {})
-    indicator_series = indicators.get('indicators', {})
     
     current_price = latest.get('current_price', 0)
     sma_50 = latest.get('sma_50')
@@ -159,27 +157,24 @@ def generate_long_term_signal(indicators: Dict, price_data: pd.DataFrame, recomm
     
     # SMA50 vs SMA200 Analysis (Golden/Death Cross)
     if sma_50 is not None and sma_200 is not None:
-        sma_50_series = indicator_series.get('sma_50', pd.Series())
-        sma_200_series = indicator_series.get('sma_200', pd.Series())
+        prev_sma50 = latest.get('prev_sma_50')
+        prev_sma200 = latest.get('prev_sma_200')
+        has_prev = prev_sma50 is not None and prev_sma200 is not None
         
-        if not sma_50_series.empty and not sma_200_series.empty and len(sma_50_series) >= 2:
-            prev_sma50 = sma_50_series.iloc[-2]
-            prev_sma200 = sma_200_series.iloc[-2] if len(sma_200_series) >= 2 else sma_200
-            
-            # Golden Cross: SMA50 crosses above SMA200
-            if prev_sma50 <= prev_sma200 and sma_50 > sma_200:
-                buy_score += 3
-                reasons.append("Golden Cross detected (SMA50 > SMA200) - strong bullish signal")
-            # Death Cross: SMA50 crosses below SMA200
-            elif prev_sma50 >= prev_sma200 and sma_50 < sma_200:
-                sell_score += 3
-                reasons.append("Death Cross detected (SMA50 < SMA200) - strong bearish signal")
-            elif sma_50 > sma_200:
-                buy_score += 1
-                reasons.append("SMA50 above SMA200 - positive trend")
-            elif sma_50 < sma_200:
-                sell_score += 1
-                reasons.append("SMA50 below SMA200 - negative trend")
+        # Golden Cross: SMA50 crosses above SMA200
+        if has_prev and prev_sma50 <= prev_sma200 and sma_50 > sma_200:
+            buy_score += 3
+            reasons.append("Golden Cross detected (SMA50 > SMA200) - strong bullish signal")
+        # Death Cross: SMA50 crosses below SMA200
+        elif has_prev and prev_sma50 >= prev_sma200 and sma_50 < sma_200:
+            sell_score += 3
+            reasons.append("Death Cross detected (SMA50 < SMA200) - strong bearish signal")
+        elif sma_50 > sma_200:
+            buy_score += 1
+            reasons.append("SMA50 above SMA200 - positive trend")
+        elif sma_50 < sma_200:
+            sell_score += 1
+            reasons.append("SMA50 below SMA200 - negative trend")
     
     # Long-term Momentum Analysis
     if momentum is not None:
@@ -193,8 +188,8 @@ def generate_long_term_signal(indicators: Dict, price_data: pd.DataFrame, recomm
     # Analyst Recommendations Analysis
     if recommendations:
         recent_recommendations = recommendations[-5:] if len(recommendations) >= 5 else recommendations
-        buy_count = sum(1 for rec in recent_recommendations if rec.get('toGrade', '').upper() in ['BUY', 'STRONG BUY', 'OUTPERFORM'])
-        sell_count = sum(1 for rec in recent_recommendations if rec.get('toGrade', '').upper() in ['SELL', 'STRONG SELL', 'UNDERPERFORM'])
+        buy_count = sum(1 for rec in recent_recommendations if rec.get('toGrade', '').upper() in BUY_GRADES)
+        sell_count = sum(1 for rec in recent_recommendations if rec.get('toGrade', '').upper() in SELL_GRADES)
         
         if buy_count > sell_count * 2:
             buy_score += 1
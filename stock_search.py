@@ -3,6 +3,11 @@ Stock Search Module
 Provides searchable stock database with ticker and company name matching
 """
 
+from functools import lru_cache
+from itertools import islice
+from operator import itemgetter
+from typing import Iterator, Optional
+
 # Popular stocks database - ticker: (company_name, sector)
 POPULAR_STOCKS = {
     # Technology
@@ -79,6 +84,126 @@ POPULAR_STOCKS = {
     "ROKU": ("Roku Inc.", "Communication Services"),
 }
 
+# Marks a complete key in the ticker trie; '' never collides with a child,
+# since every child key is a single character
+_END = ''
+
+# Column-wise (structure-of-arrays) view of POPULAR_STOCKS; the indexes
+# below store row numbers into these tuples. The dict stays for lookups.
+_TICKERS = tuple(POPULAR_STOCKS)
+_NAMES = tuple(name for name, sector in POPULAR_STOCKS.values())
+_NAMES_LOWER = tuple(name.lower() for name in _NAMES)
+_SECTORS = tuple(sector for name, sector in POPULAR_STOCKS.values())
+_ROW = {ticker: row for row, ticker in enumerate(_TICKERS)}
+_DISPLAY_NAMES = {ticker: f"{ticker} - {name}" for ticker, name in zip(_TICKERS, _NAMES)}
+
+# Optional compiled prefix search (see _stock_search_fast.pyx); it bisects
+# a sorted ticker tuple, so keep that and the row of each sorted entry
+try:
+    from _stock_search_fast import prefix_search as _fast_prefix_search
+    HAS_FAST_SEARCH = True
+except ImportError:
+    _fast_prefix_search = None
+    HAS_FAST_SEARCH = False
+
+_SORTED_TICKERS = tuple(sorted(_TICKERS))
+_SORTED_ROWS = tuple(_ROW[ticker] for ticker in _SORTED_TICKERS)
+
+
+def _build_ticker_trie(tickers) -> dict:
+    """
+    Build a character trie over tickers; each full ticker ends in {_END: row}.
+    """
+    root = {}
+    for row, ticker in enumerate(tickers):
+        node = root
+        for ch in ticker:
+            node = node.setdefault(ch, {})
+        node[_END] = row
+    return root
+
+
+def _walk(node: dict, prefix: str) -> list:
+    """
+    Collect every row stored at or below the node reached by `prefix`.
+    """
+    for ch in prefix:
+        node = node.get(ch)
+        if node is None:
+            return []
+    
+    found = []
+    stack = [node]
+    while stack:
+        node = stack.pop()
+        for key, child in node.items():
+            if key == _END:
+                found.append(child)
+            else:
+                stack.append(child)
+    return found
+
+
+def _build_name_suffixes(names_lower) -> tuple:
+    """
+    Build a suffix array over the lowercased company names.
+    
+    Holds one (row, start) pair per character, sorted by the suffix
+    name_lower[start:], so every name containing a substring sits in one
+    contiguous run that a bisect finds in O(log n).
+    """
+    suffixes = [(row, start) for row, name_lower in enumerate(names_lower) for start in range(len(name_lower))]
+    suffixes.sort(key=lambda entry: names_lower[entry[0]][entry[1]:])
+    return tuple(suffixes)
+
+
+def _suffix_at(entry: tuple) -> str:
+    """Lowercased name suffix that a suffix array entry points at."""
+    row, start = entry
+    return _NAMES_LOWER[row][start:]
+
+
+def _name_matches(query_lower: str) -> set:
+    """
+    Rows whose lowercased company name contains `query_lower`.
+    """
+    # Bisect by hand: bisect_left only takes key= from Python 3.10
+    lo, hi = 0, len(_NAME_SUFFIXES)
+    while lo < hi:
+        mid = (lo + hi) // 2
+        if _suffix_at(_NAME_SUFFIXES[mid]) < query_lower:
+            lo = mid + 1
+        else:
+            hi = mid
+    
+    found = set()
+    i = lo
+    while i < len(_NAME_SUFFIXES) and _suffix_at(_NAME_SUFFIXES[i]).startswith(query_lower):
+        found.add(_NAME_SUFFIXES[i][0])
+        i += 1
+    return found
+
+
+def _ticker_prefix_rows(query_upper: str) -> list:
+    """
+    Rows whose ticker starts with `query_upper`, via the compiled search when
+    available and the ticker trie otherwise.
+    """
+    if HAS_FAST_SEARCH:
+        return [_SORTED_ROWS[i] for i in _fast_prefix_search(query_upper, _SORTED_TICKERS)]
+    return _walk(_TICKER_TRIE, query_upper)
+
+
+# Sort rank of each match type (lower sorts first)
+_RANK_EXACT = 0
+_RANK_PREFIX = 1
+_RANK_NAME = 2
+
+# Ticker prefix and company-name substring indexes, so autocomplete cost
+# depends on the query, not the database size
+_TICKER_TRIE = _build_ticker_trie(_TICKERS)
+_NAME_SUFFIXES = _build_name_suffixes(_NAMES_LOWER)
+
 
 def search_stocks(query: str, limit: int = 20) -> list:
     """
@@ -94,62 +219,83 @@ def search_stocks(query: str, limit: int = 20) -> list:
     if not query:
         return []
     
-    query_upper = query.upper().strip()
+    query = query.strip()
+    # Tickers are usually typed in caps already; skip the copy upper() makes
+    query_upper = query if query.isupper() else query.upper()
+    matches = _search_cached(query_upper, query.lower())
+    return [
+        {
+            "ticker": ticker,
+            "name": name,
+            "sector": sector,
+            "match_type": match_type
+        }
+        for _rank, ticker, name, sector, match_type in matches[:limit]
+    ]
+
+
+@lru_cache(maxsize=256)
+def _search_cached(query_upper: str, query_lower: str) -> tuple:
+    """
+    All matches for a normalized query, as (rank, ticker, name, sector, match_type)
+    tuples sorted by rank then ticker. Cached, since autocomplete repeats the
+    same prefixes as users type.
+    """
     results = []
+    seen = set()  # rows already in results
     
     # Exact ticker match (highest priority)
-    if query_upper in POPULAR_STOCKS:
-        name, sector = POPULAR_STOCKS[query_upper]
-        results.append({
-            "ticker": query_upper,
-            "name": name,
-            "sector": sector,
-            "match_type": "ticker_exact"
-        })
+    exact = _ROW.get(query_upper)
+    if exact is not None:
+        results.append((_RANK_EXACT, query_upper, _NAMES[exact], _SECTORS[exact], "ticker_exact"))
+        seen.add(exact)
     
     # Ticker starts with query
-    for ticker, (name, sector) in POPULAR_STOCKS.items():
-        if ticker.startswith(query_upper) and ticker != query_upper:
-            results.append({
-                "ticker": ticker,
-                "name": name,
-                "sector": sector,
-                "match_type": "ticker_prefix"
-            })
+    for row in _ticker_prefix_rows(query_upper):
+        if row != exact:
+            results.append((_RANK_PREFIX, _TICKERS[row], _NAMES[row], _SECTORS[row], "ticker_prefix"))
+            seen.add(row)
     
     # Company name contains query (case-insensitive)
-    query_lower = query.lower().strip()
-    for ticker, (name, sector) in POPULAR_STOCKS.items():
-        if query_lower in name.lower() and ticker not in [r["ticker"] for r in results]:
-            results.append({
-                "ticker": ticker,
-                "name": name,
-                "sector": sector,
-                "match_type": "name_match"
-            })
+    for row in _name_matches(query_lower):
+        if row not in seen:
+            results.append((_RANK_NAME, _TICKERS[row], _NAMES[row], _SECTORS[row], "name_match"))
+            seen.add(row)
     
     # Sort by match type priority
-    priority = {"ticker_exact": 0, "ticker_prefix": 1, "name_match": 2}
-    results.sort(key=lambda x: (priority.get(x["match_type"], 3), x["ticker"]))
+    results.sort(key=itemgetter(0, 1))
     
-    return results[:limit]
+    return tuple(results)
 
 
-def get_all_stocks() -> list:
+def iter_stocks() -> Iterator[dict]:
     """
-    Get all stocks in the database.
+    Lazily yield every stock in the database.
     
     Returns:
-        List of all stocks with ticker, name, and sector
+        Iterator of stocks with ticker, name, and sector
     """
-    return [
-        {
+    for ticker, name, sector in zip(_TICKERS, _NAMES, _SECTORS):
+        yield {
             "ticker": ticker,
             "name": name,
             "sector": sector
         }
-        for ticker, (name, sector) in POPULAR_STOCKS.items()
-    ]
+
+
+def get_all_stocks(offset: int = 0, limit: Optional[int] = None) -> list:
+    """
+    Get all stocks in the database, or one page of them.
+    
+    Args:
+        offset: Number of stocks to skip
+        limit: Maximum number of stocks to return (None for all)
+    
+    Returns:
+        List of stocks with ticker, name, and sector
+    """
+    stop = None if limit is None else offset + limit
+    return list(islice(iter_stocks(), offset, stop))
 
 
 def get_stock_display_name(ticker: str) -> str:
@@ -162,8 +308,5 @@ def get_stock_display_name(ticker: str) -> str:
     Returns:
         Formatted display string
     """
-    if ticker in POPULAR_STOCKS:
-        name, sector = POPULAR_STOCKS[ticker]
-        return f"{ticker} - {name}"
-    return ticker
+    return _DISPLAY_NAMES.get(ticker, ticker)
 
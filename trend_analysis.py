@@ -7,11 +7,104 @@ Generates AI-style trend summaries and insights including:
 - Trend visualization data
 """
 
-from typing import Dict, List
+import math
+from bisect import bisect_right
+from typing import Callable, Dict, List, Optional, Sequence, Tuple
+import numpy as np
 import pandas as pd
 from datetime import datetime
 
 
+# Analyst grades (upper-cased) counted as buy / hold / sell recommendations
+BUY_GRADES = frozenset({'BUY', 'STRONG BUY', 'OUTPERFORM'})
+HOLD_GRADES = frozenset({'HOLD', 'NEUTRAL'})
+SELL_GRADES = frozenset({'SELL', 'STRONG SELL', 'UNDERPERFORM'})
+
+
+# Grade -> bucket code (0 buy, 1 hold, 2 sell); any other grade counts as
+# _OTHER_GRADE so it is looked at but not bucketed
+_GRADE_CODES = {
+    **{grade: 0 for grade in BUY_GRADES},
+    **{grade: 1 for grade in HOLD_GRADES},
+    **{grade: 2 for grade in SELL_GRADES},
+}
+_OTHER_GRADE = 3
+
+
+def _recommendation_counts(recommendations: Optional[List], window: int) -> Tuple[int, int, int, int]:
+    """
+    Buy, hold and sell counts over the latest `window` recommendations, plus
+    how many were looked at; counted in one pass, all zeros when there are none.
+    """
+    if not recommendations:
+        return 0, 0, 0, 0
+    
+    recent = recommendations[-window:]
+    codes = np.fromiter(
+        (_GRADE_CODES.get(str(rec.get('toGrade', '')).upper(), _OTHER_GRADE) for rec in recent),
+        dtype=np.int8,
+        count=len(recent)
+    )
+    buy_count, hold_count, sell_count, _ = np.bincount(codes, minlength=4).tolist()
+    return buy_count, hold_count, sell_count, len(recent)
+
+
+def _above(x: float) -> float:
+    """Smallest float greater than x, so a bucket bound can include x itself."""
+    return math.nextafter(x, math.inf)
+
+
+# Threshold buckets for the summary sentences: value v falls in bucket
+# bisect_right(thresholds, v). Each message is a bound str.format taking v;
+# None means the bucket adds no sentence
+_RSI_THRESHOLDS = (30, 40, _above(60), _above(70))
+_RSI_MESSAGES = (
+    "RSI at {:.1f} indicates oversold conditions, potentially signaling a buying opportunity.".format,
+    None,
+    "RSI at {:.1f} suggests balanced market conditions.".format,
+    None,
+    "RSI at {:.1f} suggests overbought territory, indicating potential selling pressure.".format,
+)
+
+_MOMENTUM_THRESHOLDS = (-10, -5, _above(5), _above(10))
+_MOMENTUM_MESSAGES = (
+    "Negative momentum ({:.1f}%) indicates weakening price action.".format,
+    None,
+    "Momentum is relatively stable, suggesting consolidation.".format,
+    None,
+    "Strong upward momentum ({:.1f}%) reflects positive investor sentiment.".format,
+)
+
+_VOLATILITY_THRESHOLDS = (15, _above(30))
+_VOLATILITY_MESSAGES = (
+    "Low volatility ({:.1f}%) suggests stable, predictable price movements.".format,
+    None,
+    "High volatility ({:.1f}%) indicates significant price swings and market uncertainty.".format,
+)
+
+
+# Sentence templates for the remaining summary sections, bound once
+_PRICE_GAIN_FMT = "{} is showing positive momentum with a {:.2f}% gain.".format
+_PRICE_DECLINE_FMT = "{} is experiencing downward pressure with a {:.2f}% decline.".format
+_ANALYST_POSITIVE_FMT = "Analyst sentiment is positive with {} recent buy recommendations.".format
+_ANALYST_CAUTIOUS_FMT = "Analyst sentiment is cautious with {} recent sell recommendations.".format
+_NEWS_FMT = "Recent market news includes {} articles that may impact sentiment.".format
+_SECTOR_FMT = "Operating in the {} sector.".format
+_NO_TREND_FMT = "{} shows mixed signals with no clear trend direction.".format
+
+
+# Slot of each summary section, in the order the sentences are joined
+(_PRICE_PART, _RSI_PART, _MA_PART, _MOMENTUM_PART, _VOLATILITY_PART,
+ _VOLUME_PART, _ANALYST_PART, _NEWS_PART, _SECTOR_PART) = range(9)
+_SUMMARY_PARTS = _SECTOR_PART + 1
+
+
+def _bucket_message(value: float, thresholds: Sequence[float], messages: Sequence[Optional[Callable[[float], str]]]) -> Optional[str]:
+    """Sentence for the bucket `value` falls into, or None."""
+    template = messages[bisect_right(thresholds, value)]
+    return template(value) if template else None
+
+
 def generate_trend_summary(
     ticker: str,
     indicators: Dict,
@@ -38,7 +131,6 @@ def generate_trend_summary(
         return f"Insufficient data to generate trend summary for {ticker}."
     
     latest = indicators.get('latest', {})
-    indicator_series = indicators.get('indicators', {})
     
     current_price = latest.get('current_price', 0)
     rsi = latest.get('rsi')
@@ -48,98 +140,75 @@ def generate_trend_summary(
     sma_50 = latest.get('sma_50')
     sma_200 = latest.get('sma_200')
     
-    summary_parts = []
+    summary_parts = [None] * _SUMMARY_PARTS
     
     # Price and Momentum
     if len(price_data) >= 2:
-        price_change = ((current_price / price_data['Close'].iloc[-2]) - 1) * 100
+        price_change = ((current_price / latest.get('prev_close', current_price)) - 1) * 100
         if abs(price_change) > 0.1:
             if price_change > 0:
-                summary_parts.append(f"{ticker} is showing positive momentum with a {price_change:.2f}% gain.")
+                summary_parts[_PRICE_PART] = _PRICE_GAIN_FMT(ticker, price_change)
             else:
-                summary_parts.append(f"{ticker} is experiencing downward pressure with a {price_change:.2f}% decline.")
+                summary_parts[_PRICE_PART] = _PRICE_DECLINE_FMT(ticker, price_change)
     
     # RSI Analysis
     if rsi is not None:
-        if rsi < 30:
-            summary_parts.append(f"RSI at {rsi:.1f} indicates oversold conditions, potentially signaling a buying opportunity.")
-        elif rsi > 70:
-            summary_parts.append(f"RSI at {rsi:.1f} suggests overbought territory, indicating potential selling pressure.")
-        elif 40 <= rsi <= 60:
-            summary_parts.append(f"RSI at {rsi:.1f} suggests balanced market conditions.")
+        summary_parts[_RSI_PART] = _bucket_message(rsi, _RSI_THRESHOLDS, _RSI_MESSAGES)
     
     # Moving Average Analysis
     if sma_20 is not None and sma_50 is not None and sma_200 is not None:
         if current_price > sma_20 > sma_50 > sma_200:
-            summary_parts.append("Price structure shows strong bullish alignment with all moving averages trending upward.")
+            summary_parts[_MA_PART] = "Price structure shows strong bullish alignment with all moving averages trending upward."
         elif current_price < sma_20 < sma_50 < sma_200:
-            summary_parts.append("Price structure indicates bearish alignment with all moving averages trending downward.")
+            summary_parts[_MA_PART] = "Price structure indicates bearish alignment with all moving averages trending downward."
         elif sma_50 > sma_200:
-            summary_parts.append("SMA50 above SMA200 indicates long-term strength.")
+            summary_parts[_MA_PART] = "SMA50 above SMA200 indicates long-term strength."
         elif sma_50 < sma_200:
-            summary_parts.append("SMA50 below SMA200 suggests long-term weakness.")
+            summary_parts[_MA_PART] = "SMA50 below SMA200 suggests long-term weakness."
     
     # Momentum Analysis
     if momentum is not None:
-        if momentum > 10:
-            summary_parts.append(f"Strong upward momentum ({momentum:.1f}%) reflects positive investor sentiment.")
-        elif momentum < -10:
-            summary_parts.append(f"Negative momentum ({momentum:.1f}%) indicates weakening price action.")
-        elif -5 <= momentum <= 5:
-            summary_parts.append("Momentum is relatively stable, suggesting consolidation.")
+        summary_parts[_MOMENTUM_PART] = _bucket_message(momentum, _MOMENTUM_THRESHOLDS, _MOMENTUM_MESSAGES)
     
     # Volatility Analysis
     if volatility is not None:
-        if volatility > 30:
-            summary_parts.append(f"High volatility ({volatility:.1f}%) indicates significant price swings and market uncertainty.")
-        elif volatility < 15:
-            summary_parts.append(f"Low volatility ({volatility:.1f}%) suggests stable, predictable price movements.")
+        summary_parts[_VOLATILITY_PART] = _bucket_message(volatility, _VOLATILITY_THRESHOLDS, _VOLATILITY_MESSAGES)
     
     # Volume Analysis
-    volume_avg = indicator_series.get('volume_avg')
-    if volume_avg is not None and not volume_avg.empty and 'Volume' in price_data.columns:
-        current_volume = price_data['Volume'].iloc[-1]
-        avg_volume = volume_avg.iloc[-1]
-        if not pd.isna(avg_volume) and avg_volume > 0:
+    current_volume = latest.get('current_volume')
+    avg_volume = latest.get('avg_volume')
+    if current_volume is not None and avg_volume is not None:
+        if avg_volume > 0:
             volume_ratio = current_volume / avg_volume
             if volume_ratio > 1.5:
-                summary_parts.append("Trading volume is significantly above average, indicating strong market interest.")
+                summary_parts[_VOLUME_PART] = "Trading volume is significantly above average, indicating strong market interest."
             elif volume_ratio < 0.5:
-                summary_parts.append("Below-average trading volume suggests limited market participation.")
+                summary_parts[_VOLUME_PART] = "Below-average trading volume suggests limited market participation."
     
     # Analyst Recommendations
-    if recommendations:
-        recent_recommendations = recommendations[-5:] if len(recommendations) >= 5 else recommendations
-        buy_count = sum(1 for rec in recent_recommendations if str(rec.get('toGrade', '')).upper() in ['BUY', 'STRONG BUY', 'OUTPERFORM'])
-        hold_count = sum(1 for rec in recent_recommendations if str(rec.get('toGrade', '')).upper() in ['HOLD', 'NEUTRAL'])
-        sell_count = sum(1 for rec in recent_recommendations if str(rec.get('toGrade', '')).upper() in ['SELL', 'STRONG SELL', 'UNDERPERFORM'])
-        
-        if buy_count > 0 or sell_count > 0:
-            if buy_count > sell_count:
-                summary_parts.append(f"Analyst sentiment is positive with {buy_count} recent buy recommendations.")
-            elif sell_count > buy_count:
-                summary_parts.append(f"Analyst sentiment is cautious with {sell_count} recent sell recommendations.")
-            else:
-                summary_parts.append("Analyst recommendations are mixed.")
+    buy_count, hold_count, sell_count, _ = _recommendation_counts(recommendations, 5)
+    if buy_count > 0 or sell_count > 0:
+        if buy_count > sell_count:
+            summary_parts[_ANALYST_PART] = _ANALYST_POSITIVE_FMT(buy_count)
+        elif sell_count > buy_count:
+            summary_parts[_ANALYST_PART] = _ANALYST_CAUTIOUS_FMT(sell_count)
+        else:
+            summary_parts[_ANALYST_PART] = "Analyst recommendations are mixed."
     
     # News Sentiment
     if news:
-        summary_parts.append(f"Recent market news includes {len(news)} articles that may impact sentiment.")
+        summary_parts[_NEWS_PART] = _NEWS_FMT(len(news))
     
     # Company Info
     if info:
         sector = info.get('sector', '')
         industry = info.get('industry', '')
         if sector:
-            summary_parts.append(f"Operating in the {sector} sector.")
+            summary_parts[_SECTOR_PART] = _SECTOR_FMT(sector)
     
     # Combine all parts
-    if summary_parts:
-        summary = " ".join(summary_parts)
-    else:
-        summary = f"{ticker} shows mixed signals with no clear trend direction."
-    
-    return summary
+    summary = " ".join(part for part in summary_parts if part is not None)
+    return summary or _NO_TREND_FMT(ticker)
 
 
 def get_market_sentiment(news: List = None, recommendations: List = None) -> Dict:
@@ -159,16 +228,12 @@ def get_market_sentiment(news: List = None, recommendations: List = None) -> Dic
     }
     
     if recommendations:
-        recent = recommendations[-10:] if len(recommendations) >= 10 else recommendations
-        buy_count = sum(1 for rec in recent if str(rec.get('toGrade', '')).upper() in ['BUY', 'STRONG BUY', 'OUTPERFORM'])
-        hold_count = sum(1 for rec in recent if str(rec.get('toGrade', '')).upper() in ['HOLD', 'NEUTRAL'])
-        sell_count = sum(1 for rec in recent if str(rec.get('toGrade', '')).upper() in ['SELL', 'STRONG SELL', 'UNDERPERFORM'])
-        
+        buy_count, hold_count, sell_count, total = _recommendation_counts(recommendations, 10)
         sentiment["recommendation_summary"] = {
             "buy": buy_count,
             "hold": hold_count,
             "sell": sell_count,
-            "total": len(recent)
+            "total": total
         }
     
     return sentiment
@@ -188,14 +253,12 @@ def get_price_momentum(price_data: pd.DataFrame, periods: List[int] = [5, 10, 20
     if price_data.empty or 'Close' not in price_data.columns:
         return {}
     
-    current_price = price_data['Close'].iloc[-1]
-    momentum_dict = {}
+    close = price_data['Close'].to_numpy()
     
-    for period in periods:
-        if len(price_data) > period:
-            past_price = price_data['Close'].iloc[-period-1]
-            momentum = ((current_price / past_price) - 1) * 100
-            momentum_dict[f"{period}d"] = momentum
+    # Gather the past prices for every period with enough history at once
+    valid = np.asarray(periods, dtype=np.intp)
+    valid = valid[valid < len(close)]
+    momenta = ((close[-1] / close[-valid - 1]) - 1) * 100
     
-    return momentum_dict
+    return {f"{period}d": momentum for period, momentum in zip(valid.tolist(), momenta)}
 